@@ -2,12 +2,22 @@ from ._descriptors import Descriptor
 from ._no_val import NoValue
 from ._validator_error import ValidatorError
 from ._validators import Validator
-from .number_line import NumberLine, Range
+from .number_line import NumberLine, Range, RangeSet
 from .kwargs import check_kwargs, default_kwargs
 from .strongly_typed import strongly_typed
 
 __all__ = ["NoValue"]
-__all_exports = [ValidatorError, Descriptor, Validator, Range, NumberLine, check_kwargs, default_kwargs, strongly_typed]
+__all_exports = [
+    ValidatorError,
+    Descriptor,
+    Validator,
+    Range,
+    RangeSet,
+    NumberLine,
+    check_kwargs,
+    default_kwargs,
+    strongly_typed,
+]
 
 for _e in __all_exports:
     _e.__module__ = __name__
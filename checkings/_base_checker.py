@@ -1,11 +1,38 @@
-# ruff: noqa: E501
-
 from __future__ import annotations
 
 import collections  # noqa: F401
 import os  # noqa: F401
+import stat  # noqa: F401
 import warnings
+import weakref
 from collections.abc import Callable
+# The ABCs used by the generated checkers, aliased so that they are not exported
+from collections.abc import (  # noqa: F401
+    AsyncGenerator as _AsyncGenerator,
+    AsyncIterable as _AsyncIterable,
+    AsyncIterator as _AsyncIterator,
+    Awaitable as _Awaitable,
+    Buffer as _Buffer,
+    Callable as _Callable,
+    Collection as _Collection,
+    Container as _Container,
+    Coroutine as _Coroutine,
+    Generator as _Generator,
+    Hashable as _Hashable,
+    ItemsView as _ItemsView,
+    Iterable as _Iterable,
+    KeysView as _KeysView,
+    Mapping as _Mapping,
+    MappingView as _MappingView,
+    MutableMapping as _MutableMapping,
+    MutableSequence as _MutableSequence,
+    MutableSet as _MutableSet,
+    Reversible as _Reversible,
+    Sequence as _Sequence,
+    Set as _Set,
+    Sized as _Sized,
+    ValuesView as _ValuesView,
+)
 from typing import Self
 
 try:
@@ -21,8 +48,176 @@ from ._no_val import NoValue  # noqa
 from .number_line import NumberLine  # noqa
 from ._validator_error import ValidatorError  # noqa
 
+# Checkers which may be shared, keyed on their full configuration. The values are weak references, so checkers
+# which are no longer used are not kept.
+_CHECKER_CACHE = weakref.WeakValueDictionary()
+
+# Types of the defaults and literals for which equal values are interchangeable, so checkers using them can be
+# shared
+_SHAREABLE_TYPES = frozenset((int, float, str, bytes, bool, type(None)))
+
+
+def _share_key(value):
+    """
+    Get the key of a default or literal for sharing checkers, or None if checkers using `value` cannot be shared.
+
+    Values compare equal across types (`1 == 1.0 == True`) and `0.0 == -0.0`, so only `NoValue` and scalars of the
+    exact types above are shared, keyed on their type. Containers are not shared, since their items have the same
+    problem.
+    """
+    if value is NoValue:
+        return value
+    if type(value) not in _SHAREABLE_TYPES or (type(value) is float and value == 0):
+        return None
+    return type(value), value
+
+
+# Bits of `BaseChecker._mask`, set when the corresponding check is configured
+_MASK_TYPES = 1
+_MASK_LITERALS = 2
+_MASK_NUMBER_LINE = 4
+_MASK_VALIDATORS = 8
+
+# Factories of the specialised validation functions, per `_mask`
+_SPECIALIZER_FACTORIES = {}
+
+
+def _specializer_factory(mask):
+    """
+    Return a factory for a validation function which only does the checks in `mask`.
+
+    The function only determines whether the value is valid, when it is not, `BaseChecker._validate` is called to
+    collect all the errors. The validators are called last, so that they are not called twice.
+    """
+    if mask in _SPECIALIZER_FACTORIES:
+        return _SPECIALIZER_FACTORIES[mask]
+
+    lines = [
+        "def factory(types, literals, literals_set, number_line, validators):",
+        "    def specialized(checker, value, name):",
+    ]
+    if mask & _MASK_TYPES:
+        lines += [
+            "        if not isinstance(value, types):",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_LITERALS:
+        # `literals_set` is None when a literal is unhashable, like in `BaseChecker._check_literal`
+        lines += [
+            "        if literals_set is None:",
+            "            found = value in literals",
+            "        else:",
+            "            try:",
+            "                found = value in literals_set",
+            "            except TypeError:",
+            "                # Unhashable values can still equal one of the literals",
+            "                found = value in literals",
+            "        if not found:",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_NUMBER_LINE:
+        lines += [
+            "        if not number_line.check(value):",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_VALIDATORS:
+        lines += [
+            "        val_err = checker._check_validators(value)",
+            "        if val_err is not None:",
+            "            msg = f'{name} has incorrect value: {value}'",
+            "            raise ValidatorError(msg, (val_err,))",
+        ]
+    lines += [
+        "        return None",
+        "    return specialized",
+    ]
+    namespace = {"ValidatorError": ValidatorError}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    _SPECIALIZER_FACTORIES[mask] = namespace["factory"]
+    return namespace["factory"]
+
+
+def _unspecialized(checker, value, name):
+    checker._validate(value, name)
+
+
+def _add_singleton(a, b, name):
+    """Combine two values of which at most one may be set, as done by `BaseChecker.__add__`."""
+    if a is not NoValue:
+        if b is not NoValue:
+            msg = f"Cannot add two {name}"
+            raise ValueError(msg)
+        return a
+    return b
+
 
 class BaseChecker:
+    __slots__ = (
+        "_default",
+        "_default_mutable",
+        "_default_factory",
+        "_number_line",
+        "_literals",
+        "_literals_set",
+        "_types",
+        "_converter",
+        "_validators",
+        "_replace_none",
+        "_configuration",
+        "_dirty",
+        "_mask",
+        "_specialized",
+        "__weakref__",
+    )
+
+    # Whether identically configured instances may be shared. Only enable this for subclasses which do not store any
+    # state on the instance besides the configuration.
+    _share_instances = False
+
+    def __new__(
+        cls,
+        default=NoValue,
+        default_factory=NoValue,
+        number_line=NoValue,
+        literals=NoValue,
+        types=NoValue,
+        converter=NoValue,
+        validators=NoValue,
+        replace_none=False,
+    ):
+        if not cls._share_instances:
+            return super().__new__(cls)
+
+        default_key = _share_key(default)
+        if isinstance(literals, tuple):
+            literals_key = tuple(map(_share_key, literals))
+            shareable_literals = None not in literals_key
+        else:
+            literals_key = _share_key(literals)
+            shareable_literals = literals_key is not None
+        if default_key is None or not shareable_literals:
+            return super().__new__(cls)
+        key = (
+            cls,
+            default_key,
+            default_factory,
+            number_line,
+            literals_key,
+            types,
+            converter,
+            validators,
+            replace_none,
+        )
+        try:
+            instance = _CHECKER_CACHE.get(key)
+        except TypeError:
+            # Unhashable configuration, such as a mutable default, cannot be shared
+            return super().__new__(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            _CHECKER_CACHE[key] = instance
+        return instance
+
     def __init__(
         self,
         default=NoValue,
@@ -43,15 +238,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -66,6 +262,9 @@ class BaseChecker:
             If both `default` and `default_factory` are provided, or if `literals`, `types`, or `validators` are not
             tuples or the correct type, or if `number_line` is empty.
         """
+        if self._share_instances and getattr(self, "_mask", None) is not None:
+            # A shared instance returned by `__new__`, which already has this configuration
+            return
 
         def check_tuple(value, type_, name) -> tuple:
             if (not isinstance(value, tuple)) and (value is not NoValue):
@@ -84,92 +283,135 @@ class BaseChecker:
         if not isinstance(literals, tuple | type(NoValue)):
             literals = (literals,)
 
-        if not hasattr(default, "__hash__"):
-            try:
-                default.copy()
-            except AttributeError as e:
-                msg = "If default is mutable (ie. doesn't have an hash), it must have a `copy` method"
-                raise ValueError(msg) from e
+        # Mutable objects, such as lists, set `__hash__` to None
+        default_mutable = getattr(default, "__hash__", None) is None
+        if default_mutable and not callable(getattr(default, "copy", None)):
+            msg = "If default is mutable (ie. doesn't have an hash), it must have a `copy` method"
+            raise ValueError(msg)
 
         self._default = default
+        self._default_mutable = default_mutable
         self._default_factory = check_type(default_factory, Callable, "default_factory")
         if (default is not NoValue) and (default_factory is not NoValue):
             msg = "Cannot use both `default` and `default_factory`"
             raise ValueError(msg)
         self._number_line = check_type(number_line, NumberLine, "number_line")
         self._literals = check_type(literals, tuple, "literals")
+        # Set by `_update` when all literals are hashable, for faster membership checks
+        self._literals_set = None
         self._types = check_tuple(types, type, "types")
         self._converter = check_type(converter, Callable, "converter")
         self._validators = check_tuple(validators, Callable, "validators")
         self._replace_none = replace_none
+        # The configuration as given, since `_update` normalises the attributes above in place. Combining checkers
+        # must not depend on whether (a shared instance of) a checker has been used.
+        self._configuration = (
+            self._default,
+            self._default_factory,
+            self._number_line,
+            self._literals,
+            self._types,
+            self._converter,
+            self._validators,
+            self._replace_none,
+        )
+        self._mask = (
+            (_MASK_TYPES if self._types is not NoValue else 0)
+            | (_MASK_LITERALS if self._literals is not NoValue else 0)
+            | (_MASK_NUMBER_LINE if self._number_line is not NoValue else 0)
+            | (_MASK_VALIDATORS if self._validators is not NoValue else 0)
+        )
+        # Whether the configuration still has to be normalised by `_update`
+        self._dirty = True
+        # Validation function specialised to the configuration by `_update`, called as `func(self, value, name)`
+        self._specialized = _unspecialized
 
     def _update(self):
+        if not self._dirty:
+            return
+        # The warnings are emitted together at the end, with a single call to `warnings.warn`
+        pending_warnings = []
         if (self._number_line is not NoValue) and (not self._number_line):
             msg = "Number line is empty"
             raise ValueError(msg)
         if self._literals is not NoValue:
-            # To keep the order of the literals, we need to do it this way instead of using a set
-            self._literals = tuple(
-                self._literals[i] for i in range(len(self._literals)) if self._literals[i] not in self._literals[:i]
-            )
+            # A dict keeps the order of the literals, unlike a set
+            try:
+                self._literals = tuple(dict.fromkeys(self._literals))
+            except TypeError:
+                # Unhashable literals can only be compared by equality
+                self._literals = tuple(
+                    self._literals[i] for i in range(len(self._literals)) if self._literals[i] not in self._literals[:i]
+                )
             if not self._literals:
                 msg = "Literals are empty"
                 raise ValueError(msg)
         if self._types is not NoValue:
-            self._types = tuple(set(self._types))
+            # Unlike a set, a dict keeps the order in which the types were given
+            self._types = tuple(dict.fromkeys(self._types))
             if not self._types:
                 msg = "Types are empty"
                 raise ValueError(msg)
 
             if self._literals is not NoValue:
+                types = self._types
                 old_len = len(self._literals)
-                self._literals = tuple(literal for literal in self._literals if isinstance(literal, self._types))
+                self._literals = tuple(literal for literal in self._literals if isinstance(literal, types))
                 if not self._literals:
                     msg = "No literals are of the required type"
                     raise ValueError(msg)
                 if len(self._literals) != old_len:
-                    warnings.warn(
+                    pending_warnings.append(
                         "Some literals are not of the required type, they are removed from `literals`",
                     )
 
                 old_len = len(self._types)
-                self._types = tuple(t for t in self._types if any(isinstance(literal, t) for literal in self._literals))
+                literal_types = {type(literal) for literal in self._literals}
+                self._types = tuple(t for t in types if any(issubclass(lt, t) for lt in literal_types))
                 if old_len != len(self._types):
-                    warnings.warn(
+                    pending_warnings.append(
                         "Some types are not present in `literals`, they are removed from `types`",
                     )
 
             if (self._number_line is not NoValue) and (int not in self._types) and (float not in self._types):
                 self._number_line = NoValue
-                warnings.warn(
-                    "number_line` is not used because `types` does not contain `int` or `float`",
+                self._mask &= ~_MASK_NUMBER_LINE
+                pending_warnings.append(
+                    "`number_line` is not used because `types` does not contain `int` or `float`",
                 )
 
+        if self._literals is not NoValue:
+            try:
+                self._literals_set = frozenset(self._literals)
+            except TypeError:
+                self._literals_set = None
+
+        self._specialized = _specializer_factory(self._mask)(
+            self._types, self._literals, self._literals_set, self._number_line, self._validators,
+        )
+        self._dirty = False
+        if pending_warnings:
+            warnings.warn("\n".join(pending_warnings), stacklevel=3)
+
     def __add__(self, other: Self) -> Self:
         if not isinstance(other, self.__class__):
             msg = f"Cannot add {type(other)} to {self.__class__}"
             raise TypeError(msg)
 
-        def add_values(a, b, name):
-            if a is not NoValue:
-                if b is not NoValue:
-                    msg = f"Cannot add two {name}"
-                    raise ValueError(msg)
-                result = a
-            else:
-                result = b
-            return result
-
-        default = add_values(self._default, other._default, "default values")
-        converter = add_values(self._converter, other._converter, "converters")
-        default_factory = add_values( self._default_factory, other._default_factory, "default factories")
+        # The (own, other) pair of each setting, as configured
+        default, default_factory, number_line, literals, types, converter, validators, replace_none = zip(
+            self._configuration, other._configuration, strict=True,
+        )
+        default = _add_singleton(*default, "default values")
+        converter = _add_singleton(*converter, "converters")
+        default_factory = _add_singleton(*default_factory, "default factories")
 
         # Tuples can be added together directly
-        validators = self._validators + other._validators
-        number_line = self._number_line + other._number_line
-        literals = self._literals + other._literals
-        types = self._types + other._types
-        replace_none = self._replace_none or other._replace_none
+        validators = validators[0] + validators[1]
+        number_line = number_line[0] + number_line[1]
+        literals = literals[0] + literals[1]
+        types = types[0] + types[1]
+        replace_none = replace_none[0] or replace_none[1]
 
         return self.__class__(
             default=default,
@@ -183,63 +425,67 @@ class BaseChecker:
         )
 
     def _check_type(self, value):
-        if self._types is not NoValue:
-            for t in self._types:
-                if isinstance(value, t):
-                    break
+        # `_types` is already a tuple, which `isinstance` accepts directly
+        if self._mask & _MASK_TYPES and not isinstance(value, self._types):
+            if len(self._types) == 1:
+                msg = f"Value ({value}) must be of type {self._types[0].__name__}, found {type(value).__name__}"
             else:
-                if len(self._types) == 1:
-                    msg = f"Value ({value}) must be of type {self._types[0].__name__}, found {type(value).__name__}"
-                else:
-                    msg = (f"Value ({value}) must be one of the following types: "
-                           f"{self._tuple_str([t.__name__ for t in self._types])}, found {type(value).__name__}")
-                return TypeError(msg)
+                names = ", ".join(repr(t.__name__) for t in self._types)
+                msg = f"Value ({value}) must be one of the following types: ({names}), found {type(value).__name__}"
+            return TypeError(msg)
         return None
 
     def _check_literal(self, value):
-        if (self._literals is not NoValue) and (value not in self._literals):
+        if not self._mask & _MASK_LITERALS:
+            return None
+        if self._literals_set is not None:
+            try:
+                found = value in self._literals_set
+            except TypeError:
+                # Unhashable values can still equal one of the literals
+                found = value in self._literals
+        else:
+            found = value in self._literals
+        if not found:
             msg = f"Value ({value}) must be one of the following: {self._tuple_str(self._literals)}"
             return ValueError(msg)
         return None
 
     def _check_number_line(self, value):
-        if self._number_line is not NoValue:
+        if self._mask & _MASK_NUMBER_LINE:
             return self._number_line.return_raise_check(value)
         return None
 
     def _check_validators(self, value):
-        if self._validators is not NoValue:
-            errors = []
+        if self._mask & _MASK_VALIDATORS:
+            # Only allocated when a validator fails
+            errors = None
             for validator in self._validators:
                 try:
                     message = validator(value)
                 except BaseException as e:  # noqa: BLE001
                     msg = f"Validator named {validator.__name__} raised an exception: {e}"
-                    errors.append(ValueError(msg))
-                else:
-                    if isinstance(message, Exception):
-                        errors.append(message)
+                    message = ValueError(msg)
+                if isinstance(message, Exception):
+                    if errors is None:
+                        errors = []
+                    errors.append(message)
             if errors:
                 return ValidatorError("Value did not pass all validators", errors)
         return None
 
     def _validate(self, value, name):
-        errs = []
+        if not self._mask:
+            return
         type_err = self._check_type(value)
         lit_err = self._check_literal(value)
         num_err = self._check_number_line(value)
         val_err = self._check_validators(value)
-        if type_err:
-            errs.append(type_err)
-        if lit_err:
-            errs.append(lit_err)
-        if num_err:
-            errs.append(num_err)
-        if val_err:
-            errs.append(val_err)
-        if errs:
-            msg = f"{name} has incorrect value: {value}"
-            raise ValidatorError(msg, errs)
+        if type_err is None and lit_err is None and num_err is None and val_err is None:
+            return
+        errs = tuple(err for err in (type_err, lit_err, num_err, val_err) if err is not None)
+        msg = f"{name} has incorrect value: {value}"
+        raise ValidatorError(msg, errs)
 
     @staticmethod
     def _tuple_str(values):
@@ -257,10 +503,9 @@ class BaseChecker:
     def _get_default(self):
         if self._default is NoValue:
             return self._default_factory() if self._default_factory is not NoValue else NoValue
-        if not hasattr(self._default, "__hash__"):
+        if self._default_mutable:
             return self._default.copy()
-        else:
-            return self._default
+        return self._default
 
     @staticmethod
     def _invert(func):
@@ -289,15 +534,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -313,7 +559,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_larger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -335,15 +581,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -359,7 +606,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_bigger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -381,15 +628,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -405,7 +653,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_smaller_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -427,15 +675,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -451,7 +700,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_less_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -473,15 +722,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -497,7 +747,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_in_range(cls, start_val: float, end_val: float, *, start_inclusive: bool = True, end_inclusive: bool = True, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -523,15 +773,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -547,7 +798,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def integer_between(cls, start_val: float, end_val: float, *, start_inclusive: bool = False, end_inclusive: bool = False, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -573,15 +824,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -597,7 +849,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_greater_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -619,15 +871,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -643,7 +896,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_larger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -665,15 +918,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -689,7 +943,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_bigger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -711,15 +965,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -735,7 +990,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_smaller_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -757,15 +1012,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -781,7 +1037,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_less_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -803,15 +1059,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -827,7 +1084,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_in_range(cls, start_val: float, end_val: float, *, start_inclusive: bool = True, end_inclusive: bool = True, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -853,15 +1110,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -877,7 +1135,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def number_between(cls, start_val: float, end_val: float, *, start_inclusive: bool = False, end_inclusive: bool = False, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -903,15 +1161,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -927,7 +1186,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_greater_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -949,15 +1208,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -973,7 +1233,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_larger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -995,15 +1255,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1019,7 +1280,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_bigger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1041,15 +1302,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1065,7 +1327,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_smaller_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1087,15 +1349,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1111,7 +1374,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_less_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1133,15 +1396,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1157,7 +1421,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_in_range(cls, start_val: float, end_val: float, *, start_inclusive: bool = True, end_inclusive: bool = True, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1183,15 +1447,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1207,7 +1472,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def float_between(cls, start_val: float, end_val: float, *, start_inclusive: bool = False, end_inclusive: bool = False, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1233,15 +1498,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1257,7 +1523,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_greater_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1279,15 +1545,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1303,7 +1570,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_larger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1325,15 +1592,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1349,7 +1617,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_bigger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1371,15 +1639,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1395,7 +1664,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_smaller_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1417,15 +1686,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1441,7 +1711,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_less_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1463,15 +1733,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1487,7 +1758,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_in_range(cls, start_val: float, end_val: float, *, start_inclusive: bool = True, end_inclusive: bool = True, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1513,15 +1784,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1537,7 +1809,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def int_between(cls, start_val: float, end_val: float, *, start_inclusive: bool = False, end_inclusive: bool = False, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1563,15 +1835,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1587,7 +1860,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def positive_integer(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1607,15 +1880,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1631,7 +1905,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.positive(include_zero=include_zero),) + cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.positive(include_zero=include_zero), types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def positive_number(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1651,15 +1925,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1675,7 +1950,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.positive(include_zero=include_zero),) + cls(types=(int, float),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.positive(include_zero=include_zero), types=(int, float),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def positive_float(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1695,15 +1970,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1719,7 +1995,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.positive(include_zero=include_zero),) + cls(types=(float,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.positive(include_zero=include_zero), types=(float,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def positive_int(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1739,15 +2015,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1763,7 +2040,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.positive(include_zero=include_zero),) + cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.positive(include_zero=include_zero), types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def negative_integer(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1783,15 +2060,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1807,7 +2085,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.negative(include_zero=include_zero),) + cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.negative(include_zero=include_zero), types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def negative_number(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1827,15 +2105,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1851,7 +2130,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.negative(include_zero=include_zero),) + cls(types=(int, float),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.negative(include_zero=include_zero), types=(int, float),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def negative_float(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1871,15 +2150,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1895,7 +2175,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.negative(include_zero=include_zero),) + cls(types=(float,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.negative(include_zero=include_zero), types=(float,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def negative_int(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1915,15 +2195,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1939,7 +2220,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=NumberLine.negative(include_zero=include_zero),) + cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=NumberLine.negative(include_zero=include_zero), types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def greater_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -1961,15 +2242,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -1985,7 +2267,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def larger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2007,15 +2289,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2031,7 +2314,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def bigger_than(cls, min_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2053,15 +2336,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2077,7 +2361,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.bigger_than_float(value=min_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def smaller_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2099,15 +2383,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2123,7 +2408,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def less_than(cls, max_val: float, inclusive: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2145,15 +2430,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2169,7 +2455,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.smaller_than_float(value=max_val, inclusive=inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def in_range(cls, start_val: float, end_val: float, *, start_inclusive: bool = True, end_inclusive: bool = True, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2195,15 +2481,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2219,7 +2506,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def between(cls, start_val: float, end_val: float, *, start_inclusive: bool = False, end_inclusive: bool = False, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2245,15 +2532,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2269,7 +2557,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.between_float(start=start_val, end=end_val, start_inclusive=start_inclusive, end_inclusive=end_inclusive),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def positive(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2289,15 +2577,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2313,7 +2602,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.positive(include_zero=include_zero),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.positive(include_zero=include_zero),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def negative(cls, include_zero: bool, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2333,15 +2622,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2357,7 +2647,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),) + cls(number_line=NumberLine.negative(include_zero=include_zero),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float), number_line=NumberLine.negative(include_zero=include_zero),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def even(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2372,15 +2662,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2396,7 +2687,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(validators=is_even(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), validators=is_even(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def odd(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2411,15 +2702,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2435,7 +2727,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),) + cls(validators=is_odd(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,), validators=is_odd(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def contains(cls, contains: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2455,15 +2747,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2479,51 +2772,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_contains(contains=contains),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
-     
-    # @classmethod
-    # def literals(cls, literals: collections.abc.Sequence, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
-    #     """
-    #     Generate checker to check if the value is one of `literals`.
-    #
-    #     Parameters
-    #     ----------
-    #     literals: collections.abc.Sequence
-    #         The literals to check against
-    #
-    #     Other Parameters
-    #     -------
-    #     default: object
-    #         The default value of the attribute. If default is mutable, it must have a `copy` method. An object is
-    #         considered mutable if it does not have a `__hash__` method.
-    #     default_factory: Callable[[], object]
-    #         A function that returns the default value of the attribute.
-    #     number_line: NumberLine
-    #         The number line that the attribute must be on
-    #     literals: tuple[object, ...] | object
-    #         The literals that the attribute must be
-    #     types: tuple[type, ...] | type
-    #         The types that the attribute must be
-    #     converter: Callable[[object], object]
-    #         A function that converts the attribute to the correct type
-    #     validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-    #         A tuple of functions that check if the attribute is valid
-    #     replace_none: bool
-    #         Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
-    #         default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
-    #         the default value.
-    #
-    #     Returns
-    #     -------
-    #     Self
-    #         A new instance of the class with the given validators and other parameters applied
-    #
-    #     Notes
-    #     -------
-    #     The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
-    #     raise errors when also trying to set the same value manually.
-    #     """
-    #     return cls(literals=literals,)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_contains(contains=contains),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def non_zero(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2538,15 +2787,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2562,7 +2812,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(number_line=non_zero(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(number_line=non_zero(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def length(cls, length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2582,15 +2832,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2606,7 +2857,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_len(length=length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_len(length=length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def lengths(cls, min_length: int, max_length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2628,15 +2879,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2652,7 +2904,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_lens(min_length=min_length, max_length=max_length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_lens(min_length=min_length, max_length=max_length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sorted(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2667,15 +2919,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2691,7 +2944,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_sorted(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_sorted(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_int(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2706,15 +2959,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2730,7 +2984,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_float(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2745,15 +2999,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2769,7 +3024,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(float,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(float,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_str(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2784,15 +3039,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2808,7 +3064,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(str,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(str,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_tuple(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2823,15 +3079,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2847,7 +3104,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_dict(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2862,15 +3119,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2886,7 +3144,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(dict,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(dict,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_list(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2901,15 +3159,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2925,7 +3184,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_slice(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2940,15 +3199,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -2964,7 +3224,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(slice,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(slice,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_integer(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -2979,15 +3239,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3003,7 +3264,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_number(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3018,15 +3279,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3042,7 +3304,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(int, float),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(int, float),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_string(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3057,15 +3319,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3081,7 +3344,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(str,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(str,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_dictionary(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3096,15 +3359,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3120,7 +3384,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(dict,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(dict,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_container(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3135,15 +3399,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3159,7 +3424,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Container,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Container,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_hashable(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3174,15 +3439,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3198,7 +3464,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Hashable,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Hashable,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_iterable(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3213,15 +3479,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3237,7 +3504,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Iterable,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Iterable,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_reversible(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3252,15 +3519,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3276,7 +3544,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Reversible,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Reversible,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_generator(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3291,15 +3559,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3315,7 +3584,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Generator,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Generator,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_sized(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3330,15 +3599,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3354,7 +3624,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sized,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sized,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_callable(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3369,15 +3639,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3393,7 +3664,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Callable,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Callable,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_collection(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3408,15 +3679,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3432,7 +3704,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Collection,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Collection,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_sequence(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3447,15 +3719,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3471,7 +3744,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_mutable_sequence(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3486,15 +3759,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3510,7 +3784,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.MutableSequence,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_MutableSequence,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_byte_string(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3525,15 +3799,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3549,7 +3824,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.ByteString,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(collections.abc.ByteString,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_set(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3564,15 +3839,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3588,7 +3864,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Set,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Set,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_mutable_set(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3603,15 +3879,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3627,7 +3904,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.MutableSet,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_MutableSet,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_mapping(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3642,15 +3919,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3666,7 +3944,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Mapping,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Mapping,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_mutable_mapping(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3681,15 +3959,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3705,7 +3984,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.MutableMapping,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_MutableMapping,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_mapping_view(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3720,15 +3999,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3744,7 +4024,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.MappingView,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_MappingView,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_items_view(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3759,15 +4039,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3783,7 +4064,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.ItemsView,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_ItemsView,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_keys_view(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3798,15 +4079,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3822,7 +4104,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.KeysView,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_KeysView,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_values_view(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3837,15 +4119,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3861,7 +4144,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.ValuesView,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_ValuesView,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_awaitable(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3876,15 +4159,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3900,7 +4184,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Awaitable,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Awaitable,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_async_iterable(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3915,15 +4199,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3939,7 +4224,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.AsyncIterable,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_AsyncIterable,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_async_iterator(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3954,15 +4239,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -3978,7 +4264,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.AsyncIterator,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_AsyncIterator,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_coroutine(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -3993,15 +4279,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4017,7 +4304,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Coroutine,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Coroutine,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_async_generator(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4032,15 +4319,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4056,7 +4344,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.AsyncGenerator,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_AsyncGenerator,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_buffer(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4071,15 +4359,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4095,7 +4384,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Buffer,),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Buffer,),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of(cls, of_type: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4115,15 +4404,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4139,7 +4429,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=of_type),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=of_type),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_int(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4154,15 +4444,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4178,7 +4469,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_float(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4193,15 +4484,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4217,7 +4509,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(float,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(float,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_str(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4232,15 +4524,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4256,7 +4549,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_tuple(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4271,15 +4564,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4295,7 +4589,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(tuple,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(tuple,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_dict(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4310,15 +4604,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4334,7 +4629,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_list(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4349,15 +4644,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4373,7 +4669,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(list,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(list,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_slice(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4388,15 +4684,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4412,7 +4709,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(slice,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(slice,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_integer(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4427,15 +4724,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4451,7 +4749,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_number(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4466,15 +4764,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4490,7 +4789,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(int, float)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(int, float)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_string(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4505,15 +4804,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4529,7 +4829,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_dictionary(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4544,15 +4844,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4568,7 +4869,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of(cls, of_type: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4588,15 +4889,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4612,7 +4914,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=of_type),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=of_type),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_int(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4627,15 +4929,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4651,7 +4954,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_float(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4666,15 +4969,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4690,7 +4994,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(float,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(float,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_str(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4705,15 +5009,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4729,7 +5034,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_tuple(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4744,15 +5049,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4768,7 +5074,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(tuple,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(tuple,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_dict(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4783,15 +5089,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4807,7 +5114,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_list(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4822,15 +5129,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4846,7 +5154,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(list,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(list,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_slice(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4861,15 +5169,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4885,7 +5194,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(slice,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(slice,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_integer(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4900,15 +5209,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4924,7 +5234,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_number(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4939,15 +5249,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -4963,7 +5274,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(int, float)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(int, float)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_string(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -4978,15 +5289,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5002,7 +5314,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_dictionary(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5017,15 +5329,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5041,7 +5354,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of(cls, of_type: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5061,15 +5374,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5085,7 +5399,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=of_type),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=of_type),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_int(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5100,15 +5414,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5124,7 +5439,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_float(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5139,15 +5454,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5163,7 +5479,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(float,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(float,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_str(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5178,15 +5494,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5202,7 +5519,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_tuple(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5217,15 +5534,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5241,7 +5559,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(tuple,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(tuple,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_dict(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5256,15 +5574,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5280,7 +5599,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_list(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5295,15 +5614,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5319,7 +5639,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(list,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(list,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_slice(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5334,15 +5654,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5358,7 +5679,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(slice,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(slice,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_integer(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5373,15 +5694,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5397,7 +5719,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(int,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(int,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_number(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5412,15 +5734,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5436,7 +5759,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(int, float)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(int, float)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_string(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5451,15 +5774,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5475,7 +5799,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(str,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(str,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_dictionary(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5490,15 +5814,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5514,7 +5839,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_inside_type(type_=(dict,)),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_inside_type(type_=(dict,)),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def has_attr(cls, attr: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5534,15 +5859,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5558,7 +5884,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_has_attr(attr=attr),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_has_attr(attr=attr),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def has_method(cls, method: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5578,15 +5904,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5602,7 +5929,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_has_method(method=method),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_has_method(method=method),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def has_property(cls, property: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5622,15 +5949,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5646,7 +5974,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_has_property(property=property),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_has_property(prop=property),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def starts_with(cls, start: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5666,15 +5994,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5690,7 +6019,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(str,),) + cls(validators=check_starts_with(start=start),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(str,), validators=check_starts_with(start=start),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def ends_with(cls, end: str, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5710,15 +6039,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5734,7 +6064,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(str,),) + cls(validators=check_ends_with(end=end),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(str,), validators=check_ends_with(end=end),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy_dim(cls, dims: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5754,15 +6084,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5778,16 +6109,16 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_numpy_dims(dims=dims),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_numpy_dims(dims=dims),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
-    def numpy_shape(cls, shape: tuple[int], *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
+    def numpy_shape(cls, shape: int | tuple[int], *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
         """
         Generate checker to check if the value is an instance of a numpy array and has shape `shape`.
 
         Parameters
         ----------
-        shape: tuple[int]
+        shape: int | tuple[int]
             The correct shape
         
         Other Parameters
@@ -5798,15 +6129,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5822,7 +6154,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_numpy_shape(shape=shape),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_numpy_shape(shape=shape),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy_dtype(cls, dtype: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5842,15 +6174,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5866,7 +6199,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_numpy_dtype(dtype=dtype),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_numpy_dtype(dtype=dtype),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy_subdtype(cls, subdtype: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5886,15 +6219,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5910,7 +6244,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_numpy_subdtype(subdtype=subdtype),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_numpy_subdtype(subdtype=subdtype),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_of_length(cls, length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5930,15 +6264,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -5954,7 +6289,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_len(length=length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_len(length=length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def sequence_between_lengths(cls, min_length: int, max_length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -5976,15 +6311,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6000,7 +6336,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(collections.abc.Sequence,),) + cls(validators=check_lens(min_length=min_length, max_length=max_length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(_Sequence,), validators=check_lens(min_length=min_length, max_length=max_length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_of_length(cls, length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6020,15 +6356,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6044,7 +6381,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_len(length=length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_len(length=length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def list_between_lengths(cls, min_length: int, max_length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6066,15 +6403,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6090,7 +6428,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(list,),) + cls(validators=check_lens(min_length=min_length, max_length=max_length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(list,), validators=check_lens(min_length=min_length, max_length=max_length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_of_length(cls, length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6110,15 +6448,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6134,7 +6473,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_len(length=length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_len(length=length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def tuple_between_lengths(cls, min_length: int, max_length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6156,15 +6495,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6180,7 +6520,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(tuple,),) + cls(validators=check_lens(min_length=min_length, max_length=max_length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(tuple,), validators=check_lens(min_length=min_length, max_length=max_length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy_array_of_length(cls, length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6200,15 +6540,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6224,7 +6565,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_len(length=length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_len(length=length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy_array_between_lengths(cls, min_length: int, max_length: int, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6246,15 +6587,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6270,7 +6612,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_lens(min_length=min_length, max_length=max_length),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_lens(min_length=min_length, max_length=max_length),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_path(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6285,15 +6627,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6309,7 +6652,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_path(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_path(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_dir(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6324,15 +6667,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6348,7 +6692,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_dir(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_dir(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def is_file(cls, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6363,15 +6707,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6387,7 +6732,7 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(validators=check_file(),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(validators=check_file(),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
      
     @classmethod
     def numpy(cls, dims: int, shape: int | tuple[int], dtype: type, *, default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue) -> Self:
@@ -6411,15 +6756,16 @@ class BaseChecker:
         default_factory: Callable[[], object]
             A function that returns the default value of the attribute.
         number_line: NumberLine
-            The number line that the attribute must be on
+            A NumberLine instance which the attribute must lie on.
         literals: tuple[object, ...] | object
-            The literals that the attribute must be
+            The literals that the attribute must be one of
         types: tuple[type, ...] | type
-            The types that the attribute must be
+            The types that the attribute must be one of
         converter: Callable[[object], object]
-            A function that converts the attribute to the correct type
+            A function that converts the attribute to a new value
         validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
         replace_none: bool
             Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
             default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
@@ -6435,13 +6781,19 @@ class BaseChecker:
         The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
         raise errors when also trying to set the same value manually.
         """
-        return cls(types=(np.ndarray,),) + cls(validators=check_numpy(dims=dims, shape=shape, dtype=dtype),)+ cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
+        return cls(types=(np.ndarray,), validators=check_numpy(dims=dims, shape=shape, dtype=dtype),) + cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, types = types, converter = converter, validators = validators, replace_none = replace_none)
     
 
 
+def _stat_or_none(path):
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
 def is_even():
     def checker(value):
-        if value % 2 != 0:
+        if value % 2:
             msg = "Value must be even"
             return ValueError(msg)
         return None
@@ -6449,7 +6801,7 @@ def is_even():
 
 def is_odd():
     def checker(value):
-        if value % 2 == 0:
+        if not value % 2:
             msg = "Value must be odd"
             return ValueError(msg)
         return None
@@ -6467,52 +6819,59 @@ def non_zero():
     return NumberLine.exclude_from_floats(0, 0, False, False)
 
 def check_len(length):
+    template = "Length must be {length}, not {{found}}".format_map({"length": length})
     def checker(value):
         if len(value) != length:
-            msg = f"Length must be {length}, not {len(value)}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": len(value)}))
         return None
     return checker
 
 def check_lens(min_length, max_length):
+    template = "Length must be between {min_length} and {max_length}, not {{found}}".format_map(
+        {"min_length": min_length, "max_length": max_length},
+    )
     def checker(value):
         if not min_length <= len(value) <= max_length:
-            msg = f"Length must be between {min_length} and {max_length}, not {len(value)}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": len(value)}))
         return None
     return checker
 
 def check_sorted():
-    def checker(value):
-        def value_error(wrong):
-            return ValueError(
-                f"Value must be sorted, goes wrong at index{'es' if len(wrong) > 1 else ''} {wrong}",
-            )
-        if HAS_NUMPY:  
-            if isinstance(value, np.ndarray):  
-                values = value[:-1] <= value[1:]
-                if not np.all(values):  
-                    wrong = np.argwhere(~values)[:, 0]  
-                    return value_error(wrong)
-        elif all(value[i] <= value[i + 1] for i in range(len(value) - 1)):
-            wrong = [i for i in range(len(value) - 1) if value[i] > value[i + 1]]
+    def value_error(wrong):
+        return ValueError(
+            f"Value must be sorted, goes wrong at index{'es' if len(wrong) > 1 else ''} {wrong}",
+        )
+    def sequence_checker(value):
+        wrong = [i for i in range(len(value) - 1) if not value[i] <= value[i + 1]]
+        if wrong:
             return value_error(wrong)
         return None
-    return checker
+    # Whether numpy is available is known when the checker is made, so only check for arrays when it is
+    if not HAS_NUMPY:  
+        return sequence_checker
+    def array_checker(value):
+        if not isinstance(value, np.ndarray):  
+            return sequence_checker(value)
+        in_order = value[:-1] <= value[1:]
+        if in_order.all():
+            return None
+        wrong = np.nonzero(~in_order)[0]  
+        return value_error(wrong)
+    return array_checker
 
 def check_inside_type(type_):
+    # Unions and other special forms have no `__name__`, their repr reads as e.g. `int | str`
+    expected = " or ".join(getattr(t, "__name__", repr(t)) for t in (type_ if isinstance(type_, tuple) else (type_,)))
     def checker(value):
-        if any(not isinstance(val, type_) for val in value):
-            errors = []
-            for index, val in enumerate(value):
-                if not isinstance(val, type_):
-                    errors.append(f"value at {index} is of type {type(val)}")
-            if len(errors) == 1:
-                msg = f"Value must contain only values of type {type_}. Error: {errors[0]}"
-                return ValueError(msg)
-            msg = f"Value must contain only values of type {type_}. Errors: {', '.join(errors[:-1])}, and {errors[-1]}"
+        wrong = [(index, type(val).__name__) for index, val in enumerate(value) if not isinstance(val, type_)]
+        if not wrong:
+            return None
+        errors = [f"value at {index} is of type {found}" for index, found in wrong]
+        if len(errors) == 1:
+            msg = f"Value must contain only values of type {expected}. Error: {errors[0]}"
             return ValueError(msg)
-        return None
+        msg = f"Value must contain only values of type {expected}. Errors: {', '.join(errors[:-1])}, and {errors[-1]}"
+        return ValueError(msg)
     return checker
 
 def check_has_attr(attr):
@@ -6531,51 +6890,56 @@ def check_has_method(method):
         return None
     return checker
 
-def check_has_property(property):
+def check_has_property(prop):
     def checker(value):
-        if not hasattr(value, property) or not isinstance(getattr(value, property), property):
-            msg = f"Value must have property {property}"
+        # Look the property up on the class, so that the getter is not called
+        if not isinstance(getattr(type(value), prop, None), property):
+            msg = f"Value must have property {prop}"
             return ValueError(msg)
         return None
     return checker
 
 def check_starts_with(start):
+    length = len(start)
     def checker(value):
-        if not value.startswith(start):
+        if value[:length] != start:
             msg = f"Value must start with {start}"
             return ValueError(msg)
         return None
     return checker
 
 def check_ends_with(end):
+    length = len(end)
     def checker(value):
-        if not value.endswith(end):
+        if length and value[-length:] != end:
             msg = f"Value must end with {end}"
             return ValueError(msg)
         return None
     return checker
 
 def check_numpy_dims(dims):
+    template = "Value must have {dims} dimensions, not {{found}}".format_map({"dims": dims})
     def checker(value):
         if value.ndim != dims:
-            msg = f"Value must have {dims} dimensions, not {value.ndim}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.ndim}))
         return None
     return checker
 
 def check_numpy_shape(shape):
+    if isinstance(shape, int):
+        shape = (shape,)
+    template = "Value must have shape {shape}, not {{found}}".format_map({"shape": shape})
     def checker(value):
         if value.shape != shape:
-            msg = f"Value must have shape {shape}, not {value.shape}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.shape}))
         return None
     return checker
 
 def check_numpy_dtype(dtype):
+    template = "Value must have dtype {dtype}, not {{found}}".format_map({"dtype": dtype})
     def checker(value):
         if value.dtype != dtype:
-            msg = f"Value must have dtype {dtype}, not {value.dtype}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.dtype}))
         return None
     return checker
 
@@ -6589,7 +6953,7 @@ def check_numpy_subdtype(subdtype):
 
 def check_path():
     def checker(value):
-        if not os.path.exists(value):
+        if _stat_or_none(value) is None:
             msg = f"Path `{value}` does not exist"
             return ValueError(msg)
         return None
@@ -6597,7 +6961,8 @@ def check_path():
 
 def check_dir():
     def checker(value):
-        if not os.path.isdir(value):
+        result = _stat_or_none(value)
+        if result is None or not stat.S_ISDIR(result.st_mode):
             msg = f"Path `{value}` is not a directory"
             return ValueError(msg)
         return None
@@ -6605,26 +6970,25 @@ def check_dir():
 
 def check_file():
     def checker(value):
-        if not os.path.isfile(value):
+        result = _stat_or_none(value)
+        if result is None or not stat.S_ISREG(result.st_mode):
             msg = f"Path `{value}` is not a file"
             return ValueError(msg)
         return None
     return checker
 
 def check_numpy(dims, shape, dtype):
+    if isinstance(shape, int):
+        shape = (shape,)
     def checker(value):
-        nonlocal shape
+        if value.ndim == dims and value.shape == shape and value.dtype == dtype:
+            return None
         if value.ndim != dims:
             msg = f"Value must have {dims} dimensions, not {value.ndim}"
-            return ValueError(msg)
-        if isinstance(shape, int):
-            shape = (shape,)
-        if value.shape != shape:
+        elif value.shape != shape:
             msg = f"Value must have shape {shape}, not {value.shape}"
-            return ValueError(msg)
-        if value.dtype != dtype:
+        else:
             msg = f"Value must have dtype {dtype}, not {value.dtype}"
-            return ValueError(msg)
-        return None
+        return ValueError(msg)
     return checker
 
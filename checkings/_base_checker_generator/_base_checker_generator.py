@@ -1,20 +1,41 @@
 from __future__ import annotations
 
 import inspect
+import io
 import itertools
 import os
 import pathlib
-import shutil
+import py_compile
+import re
+import stat
 from collections.abc import Callable, Iterable, Sequence
-from dataclasses import KW_ONLY, dataclass
+from dataclasses import KW_ONLY, dataclass, field, replace
+from functools import cache
 import numpy as np
 
 from checkings._no_val import NoValue
 
 VALIDATOR_FUNCS = {}
 
+# The signature line of an `add_func` source
+_DEF_LINE = re.compile(r"^def[^\n]*$", re.MULTILINE)
 
-@dataclass
+# Placeholders in docstring descriptions, `{0}` is replaced by the name of the first parameter, etc. Placeholders
+# without a value are kept, so that they can be filled in later.
+_PLACEHOLDER = re.compile(r"\{(\d+)\}")
+
+
+def _fill_placeholders(template: str, values: dict[str, str]) -> str:
+    return _PLACEHOLDER.sub(lambda match: values.get(match[1], match[0]), template)
+
+
+# Reading the source means reading and parsing the file, which is only needed once per function
+@cache
+def _source_of(func: Callable) -> str:
+    return inspect.getsource(func)
+
+
+@dataclass(frozen=True, slots=True)
 class Parameter:
     name: str | None
     param_name: str
@@ -26,20 +47,10 @@ class Parameter:
 
     def __post_init__(self):
         if self.call_value is NoValue:
-            self.call_value = self.name
-
-    def copy(self):
-        return Parameter(
-            self.name,
-            self.param_name,
-            self.type,
-            self.description,
-            default=self.default,
-            call_value=self.call_value,
-        )
+            object.__setattr__(self, "call_value", self.name)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Validator:
     name: str
     param_name: str
@@ -48,64 +59,55 @@ class Validator:
     docstring_description: str = None
     parameters: Sequence[Parameter] = None
     add_func: str | Callable = None
+    _func_key: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # The instances are frozen, so the normalised values are set with `object.__setattr__`
         if self.docstring_description is None:
-            self.docstring_description = self.name.replace("_", " ").lower()
+            object.__setattr__(self, "docstring_description", self.name.replace("_", " ").lower())
+        if self.parameters is not None:
+            object.__setattr__(self, "parameters", tuple(self.parameters))
         if isinstance(self.add_func, Callable):
-            self.add_func = "\n".join(inspect.getsourcelines(self.add_func)[0])
+            object.__setattr__(self, "add_func", _source_of(self.add_func))
+        # Name of the function defined by `add_func`, under which it is written to the generated module
+        func_key = None
+        if self.add_func is not None:
+            func_key = self.add_func.split("(", 1)[0].removeprefix("def ").strip()
+        object.__setattr__(self, "_func_key", func_key)
 
     def get_docstring_description(self):
-        description = self.docstring_description
-        if self.parameters is not None:
-            for index in range(len(self.parameters)):
-                if self.parameters[index].name is None:
-                    continue
-                description = description.replace(
-                    f"{{{index}}}",
-                    self.parameters[index].name,
-                )
-        return description
+        if self.parameters is None:
+            return self.docstring_description
+        names = {str(index): param.name for index, param in enumerate(self.parameters) if param.name is not None}
+        return _fill_placeholders(self.docstring_description, names)
 
     @staticmethod
     def combine(validators: Sequence[Validator]) -> Sequence[Validator]:
-        for index in range(len(validators)):
-            for index_p in range(len(validators[index].parameters)):
-                num = 1
-                for index2 in range(len(validators[index + 1 :])):
-                    for index_p2 in range(len(validators[index2].parameters)):
-                        if validators[index].parameters[index_p].name == validators[index2].parameters[index_p2].name:
-                            if (
-                                validators[index].parameters[index_p].name[-1].isdigit()
-                                and validators[index2].parameters[index_p2].name[-1].isdigit()
-                            ):
-                                continue
-                            if (
-                                validators[index].parameters[index_p].name[-1] != "1"
-                                and validators[index].parameters[index_p].name[-1].isdigit()
-                            ) or validators[index2].parameters[index_p2].name[-1].isdigit():
-                                raise ValueError("Something went wrong")
-
-                            if num == 1:
-                                validators[index].parameters[index_p].name += str(num)
-                                num += 1
-                            validators[index].parameters[index_p2].name += str(num)
-                            num += 1
-        return validators
-
-    def copy(self):
-        if isinstance(self.parameters, Sequence):
-            parameters = [param.copy() for param in self.parameters]
-        else:
-            parameters = self.parameters
-        return Validator(
-            self.name,
-            self.param_name,
-            self.function,
-            self.docstring_description,
-            parameters,
-            self.add_func,
-        )
+        # Group the parameters by name, so that colliding names are found in a single pass
+        buckets: dict[str, list[tuple[int, int]]] = {}
+        for index, validator in enumerate(validators):
+            for index_p, param in enumerate(validator.parameters or []):
+                if param.name is not None:
+                    buckets.setdefault(param.name, []).append((index, index_p))
+
+        new_names: dict[tuple[int, int], str] = {}
+        for name, occurrences in buckets.items():
+            # A name ending in a digit is already numbered
+            if len(occurrences) == 1 or name[-1].isdigit():
+                continue
+            for num, position in enumerate(occurrences, 1):
+                new_names[position] = f"{name}{num}"
+
+        def rename(param: Parameter, new_name: str) -> Parameter:
+            call_value = new_name if param.call_value == param.name else param.call_value
+            return replace(param, name=new_name, call_value=call_value)
+
+        combined = list(validators)
+        for (index, index_p), new_name in new_names.items():
+            parameters = list(combined[index].parameters)
+            parameters[index_p] = rename(parameters[index_p], new_name)
+            combined[index] = replace(combined[index], parameters=parameters)
+        return combined
 
     def fill_parameter_in_function(
         self,
@@ -121,36 +123,90 @@ class Validator:
         if param_name not in self.add_func:
             msg = f"Parameter {param_name} not found in add_func"
             raise ValueError(msg)
-        params = [param.copy() for param in self.parameters]
-        found = False
-        docstring_description = self.docstring_description
+        params = list(self.parameters)
+        filled = {}
         for index, param in enumerate(params):
             if param.param_name == param_name:
-                found = True
-                param.name = None
-                param.call_value = value
-                docstring_description = docstring_description.replace(
-                    f"{{{index}}}",
-                    name,
-                )
-                params[index] = param
-        if not found:
+                params[index] = replace(param, name=None, call_value=value)
+                filled[str(index)] = name
+        if not filled:
             msg = f"Parameter {param_name} not found in parameters"
             raise ValueError(msg)
-        add_func = "\n".join(
-            (line.replace(param_name, "") if "def" in line else line.replace(param_name, value))
-            for line in self.add_func.split("\n")
-        )
-        return Validator(
-            self.name,
-            self.param_name,
-            self.function,
-            docstring_description,
-            params,
-            add_func,
+        docstring_description = _fill_placeholders(self.docstring_description, filled)
+        # Only replace whole identifiers, so that names which contain `param_name` are left alone. The parameter is
+        # dropped from the signature and replaced by `value` in the body.
+        pattern = re.compile(rf"\b{re.escape(param_name)}\b")
+        signature = _DEF_LINE.search(self.add_func)
+        if signature is None:
+            add_func = pattern.sub(lambda _: value, self.add_func)
+        else:
+            start, end = signature.span()
+            add_func = (
+                pattern.sub(lambda _: value, self.add_func[:start])
+                + pattern.sub("", self.add_func[start:end])
+                + pattern.sub(lambda _: value, self.add_func[end:])
+            )
+        return replace(
+            self,
+            docstring_description=docstring_description,
+            parameters=params,
+            add_func=add_func,
         )
 
 
+# The keyword arguments shared by every generated checker, in the signature and in the call that applies them
+_KWARGS_SIG = (
+    ", default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, "
+    "types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue"
+)
+_KWARGS_CALL = (
+    "cls(default = default, default_factory = default_factory, number_line = number_line, literals = literals, "
+    "types = types, converter = converter, validators = validators, replace_none = replace_none)"
+)
+
+_CHECKER_TEMPLATE = """ 
+    @classmethod
+    def {prefix}{func_name}(cls{parameter_string}) -> Self:
+        \"\"\"
+        {description}.{parameters_header}{parameter_description}
+        
+        Other Parameters
+        -------
+        default: object
+            The default value of the attribute. If default is mutable, it must have a `copy` method. An object is
+            considered mutable if it does not have a `__hash__` method.
+        default_factory: Callable[[], object]
+            A function that returns the default value of the attribute.
+        number_line: NumberLine
+            A NumberLine instance which the attribute must lie on.
+        literals: tuple[object, ...] | object
+            The literals that the attribute must be one of
+        types: tuple[type, ...] | type
+            The types that the attribute must be one of
+        converter: Callable[[object], object]
+            A function that converts the attribute to a new value
+        validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
+            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
+            neither returns nor raises and exception.
+        replace_none: bool
+            Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
+            default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
+            the default value.
+        
+        Returns
+        -------
+        Self
+            A new instance of the class with the given validators and other parameters applied
+            
+        Notes
+        -------
+        The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
+        raise errors when also trying to set the same value manually.
+        \"\"\"{add_func}
+        return {call_string}
+    """
+
+
 def make_checker(validators: Sequence[Validator], prefix=""):
     func_name = "_".join([validator.name for validator in validators if validator.name])
 
@@ -161,49 +217,34 @@ def make_checker(validators: Sequence[Validator], prefix=""):
 
     param_validators = [validator for validator in validators if validator.parameters is not None]
     parameters = [param for validator in param_validators for param in validator.parameters]
-    parameters.sort(key=lambda x: x.default is not NoValue)
-
-    parameter_string = ""
-    found_kwargs = False
-    for param in parameters:
-        if param.name is None:
-            continue
-        if param.default is NoValue:
-            parameter_string += f", {param.name}: {param.type}"
-        else:
-            if not found_kwargs:
-                parameter_string += ", *"
-                found_kwargs = True
-            parameter_string += f", {param.name}: {param.type} = {param.default}"
-
-    kwargs = (", default = NoValue, default_factory = NoValue, number_line = NoValue, literals = NoValue, "
-              "types = NoValue, converter = NoValue, validators = NoValue, replace_none = NoValue")
-    if not found_kwargs:
-        parameter_string += ", *"
-    parameter_string += kwargs
-
+    # Parameters without a default are positional, the others are keyword-only
+    positional = [param for param in parameters if param.default is NoValue]
+    keyword = [param for param in parameters if param.default is not NoValue]
+    parameters = positional + keyword
+
+    parameter_string = "".join(
+        [f", {param_str(param)}" for param in positional if param.name is not None]
+        + [", *"]
+        + [f", {param_str(param)}" for param in keyword if param.name is not None]
+        + [_KWARGS_SIG],
+    )
 
     description_validators = [validator for validator in validators if validator.param_name != "default"]
-    description = "Generate checker to check if the value "
-    if len(description_validators) == 0:
-        description = ""
-    elif len(description_validators) == 1:
-        description += description_validators[0].get_docstring_description()
-    elif len(description_validators) == 2:
-        description += (
-            f"{description_validators[0].get_docstring_description()} "
-            f"and {description_validators[1].get_docstring_description()}"
-        )
-    else:
-        description += ", and ".join(
-            [validator.get_docstring_description() for validator in description_validators],
-        )
+    descriptions = [validator.get_docstring_description() for validator in description_validators]
+    description_parts = []
+    if len(descriptions) == 1:
+        description_parts = ["Generate checker to check if the value ", descriptions[0]]
+    elif len(descriptions) == 2:
+        description_parts = ["Generate checker to check if the value ", descriptions[0], " and ", descriptions[1]]
+    elif len(descriptions) > 2:
+        description_parts = ["Generate checker to check if the value ", ", and ".join(descriptions)]
 
     if "default" in [validator.param_name for validator in validators]:
         if len(description_validators) == 0:
-            description = "Set default value to `default`"
+            description_parts = ["Set default value to `default`"]
         else:
-            description += " with default value `default`"
+            description_parts.append(" with default value `default`")
+    description = "".join(description_parts)
 
     def param_description(param: Parameter):
         first_line = f"\t\t{param.name}: {param.type}"
@@ -217,28 +258,29 @@ def make_checker(validators: Sequence[Validator], prefix=""):
         [param_description(param) for param in parameters if param.name is not None],
     )
 
-    def call_str(validator: Validator):
+    def call_arg(validator: Validator):
         def param_string(param: Parameter):
             return f"{param.param_name}={param.call_value}"
 
-        name = "cls("
-
         if validator.param_name in ("types", "literals", "default"):
-            name += f"{validator.param_name}={validator.function}"
-        else:
-            parameters = validator.parameters or []
-            name += (
-                f"{validator.param_name}={validator.function}("
-                f"{', '.join([param_string(param) for param in parameters])})"
-            )
+            return f"{validator.param_name}={validator.function}"
+        parameters = validator.parameters or []
+        return (
+            f"{validator.param_name}={validator.function}("
+            f"{', '.join([param_string(param) for param in parameters])})"
+        )
 
-        name += "," if name[-1] != "(" else ""
-        return name + ")"
+    # When every validator sets a different keyword, they can be passed to a single `cls(...)` call, which avoids
+    # creating (and adding) an intermediate instance per validator.
+    call_args = [call_arg(validator) for validator in validators]
+    param_names = [validator.param_name for validator in validators]
+    if len(set(param_names)) == len(param_names):
+        calls = [f"cls({', '.join(call_args)},)"] if call_args else []
+    else:
+        calls = [f"cls({arg},)" for arg in call_args]
 
-    call_string = (" + ".join([call_str(validator) for validator in validators])
-                   + "+ cls(default = default, default_factory = default_factory, number_line = number_line,"
-                     " literals = literals, types = types, converter = converter, validators = validators,"
-                     " replace_none = replace_none)")
+    calls.append(_KWARGS_CALL)
+    call_string = " + ".join(calls)
 
     add_func = ""
 
@@ -246,54 +288,22 @@ def make_checker(validators: Sequence[Validator], prefix=""):
     if parameter_description:
         parameters_header = "\n\n\t\tParameters\n\t\t----------\n"
 
-    func = f""" 
-    @classmethod
-    def {prefix}{func_name}(cls{parameter_string}) -> Self:
-        \"\"\"
-        {description}.{parameters_header}{parameter_description}
-        
-        Other Parameters
-        -------
-        default: object
-            The default value of the attribute. If default is mutable, it must have a `copy` method. An object is
-            considered mutable if it does not have a `__hash__` method.
-        default_factory: Callable[[], object]
-            A function that returns the default value of the attribute.
-        number_line: NumberLine
-            A NumberLine instance which the attribute must lie on.
-        literals: tuple[object, ...] | object
-            The literals that the attribute must be one of
-        types: tuple[type, ...] | type
-            The types that the attribute must be one of
-        converter: Callable[[object], object]
-            A function that converts the attribute to a new value
-        validators: tuple[Callable[[object], Exception | None], ...] | Callable[[object], Exception | None]
-            A tuple of functions that check if the attribute is valid. The value is assumed correct when the function
-            neither returns nor raises and exception.
-        replace_none: bool
-            Whether to replace `None` values with the default value. If `True`, `None` values will be replaced with the
-            default value. If `False`, `None` values will raise an error. NoValue values will always be replaced with
-            the default value.
-        
-        Returns
-        -------
-        Self
-            A new instance of the class with the given validators and other parameters applied
-            
-        Notes
-        -------
-        The kwarg parameters described in the "Other Parameters" may already be set by the function itself, so this may
-        raise errors when also trying to set the same value manually.
-        \"\"\"{add_func}
-        return {call_string}
-    """.replace("\t", "    ")
+    func = _CHECKER_TEMPLATE.format_map(
+        {
+            "prefix": prefix,
+            "func_name": func_name,
+            "parameter_string": parameter_string,
+            "description": description,
+            "parameters_header": parameters_header,
+            "parameter_description": parameter_description,
+            "add_func": add_func,
+            "call_string": call_string,
+        },
+    ).replace("\t", "    ")
 
     for validator in validators:
-        if isinstance(validator.add_func, str):
-            val, _ = validator.add_func.split("(", 1)
-            val = val.removeprefix("def ")
-            if val not in VALIDATOR_FUNCS:
-                VALIDATOR_FUNCS[val] = validator.add_func
+        if validator.add_func is not None:
+            VALIDATOR_FUNCS.setdefault(validator._func_key, validator.add_func)
     return func
 
 
@@ -353,19 +363,19 @@ numbers = {name: types[name] for name in ["integer", "number", "float", "int"]}
 
 
 def check_inside_type(type_):
+    # Unions and other special forms have no `__name__`, their repr reads as e.g. `int | str`
+    expected = " or ".join(getattr(t, "__name__", repr(t)) for t in (type_ if isinstance(type_, tuple) else (type_,)))
+
     def checker(value):
-        if any(not isinstance(val, type_) for val in value):
-            errors = []
-            for index, val in enumerate(value):
-                if not isinstance(val, type_):
-                    errors.append(f"value at {index} is of type {type(val)}")
-
-            if len(errors) == 1:
-                msg = f"Value must contain only values of type {type_}. Error: {errors[0]}"
-                return ValueError(msg)
-            msg = f"Value must contain only values of type {type_}. Errors: {', '.join(errors[:-1])}, and {errors[-1]}"
+        wrong = [(index, type(val).__name__) for index, val in enumerate(value) if not isinstance(val, type_)]
+        if not wrong:
+            return None
+        errors = [f"value at {index} is of type {found}" for index, found in wrong]
+        if len(errors) == 1:
+            msg = f"Value must contain only values of type {expected}. Error: {errors[0]}"
             return ValueError(msg)
-        return None
+        msg = f"Value must contain only values of type {expected}. Errors: {', '.join(errors[:-1])}, and {errors[-1]}"
+        return ValueError(msg)
 
     return checker
 
@@ -407,12 +417,16 @@ abc_names = [
     "AsyncGenerator",
     "Buffer",
 ]
+# The ABCs are imported under an alias in the stub, except for ByteString, which is deprecated and therefore only
+# looked up when the checker is created.
 abcs = {
     name: Validator(
         capital_to_underscore(name),
         "types",
-        f"(collections.abc.{name},)",
-        docstring_description=f"is an instance of {a_or_an(name)} {name} (:external+python:py:class:`collections.abc.{name}`)",
+        "(collections.abc.ByteString,)" if name == "ByteString" else f"(_{name},)",
+        docstring_description=(
+            f"is an instance of {a_or_an(name)} {name} (:external+python:py:class:`collections.abc.{name}`)"
+        ),
     )
     for name in abc_names
 }
@@ -449,10 +463,11 @@ has_method = Validator(
     parameters=[Parameter("method", "method", "str", "The method to check for")],
     add_func=check_has_method,
 )
-def check_has_property(property):
+def check_has_property(prop):
     def checker(value):
-        if not hasattr(value, property) or not isinstance(getattr(value, property), property):
-            msg = f"Value must have property {property}"
+        # Look the property up on the class, so that the getter is not called
+        if not isinstance(getattr(type(value), prop, None), property):
+            msg = f"Value must have property {prop}"
             return ValueError(msg)
         return None
     return checker
@@ -461,7 +476,7 @@ has_property = Validator(
     "validators",
     "check_has_property",
     docstring_description="has property `{0}`",
-    parameters=[Parameter("property", "property", "str", "The property to check for")],
+    parameters=[Parameter("property", "prop", "str", "The property to check for")],
     add_func=check_has_property
 )
 
@@ -587,7 +602,7 @@ non_zero = Validator(
 
 def is_even():
     def checker(value):
-        if value % 2 != 0:
+        if value % 2:
             msg = "Value must be even"
             return ValueError(msg)
         return None
@@ -602,7 +617,7 @@ even = Validator(
 
 def is_odd():
     def checker(value):
-        if value % 2 == 0:
+        if not value % 2:
             msg = "Value must be odd"
             return ValueError(msg)
         return None
@@ -617,8 +632,10 @@ odd = Validator(
 
 # Strings
 def check_starts_with(start):
+    length = len(start)
+
     def checker(value):
-        if not value.startswith(start):
+        if value[:length] != start:
             msg = f"Value must start with {start}"
             return ValueError(msg)
         return None
@@ -633,8 +650,10 @@ starts_with = Validator(
 )
 
 def check_ends_with(end):
+    length = len(end)
+
     def checker(value):
-        if not value.endswith(end):
+        if length and value[-length:] != end:
             msg = f"Value must end with {end}"
             return ValueError(msg)
         return None
@@ -657,10 +676,11 @@ numpy_array = Validator(
 )
 
 def check_numpy_dims(dims):
+    template = "Value must have {dims} dimensions, not {{found}}".format_map({"dims": dims})
+
     def checker(value):
         if value.ndim != dims:
-            msg = f"Value must have {dims} dimensions, not {value.ndim}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.ndim}))
         return None
     return checker
 numpy_dims = Validator(
@@ -673,10 +693,13 @@ numpy_dims = Validator(
 )
 
 def check_numpy_shape(shape):
+    if isinstance(shape, int):
+        shape = (shape,)
+    template = "Value must have shape {shape}, not {{found}}".format_map({"shape": shape})
+
     def checker(value):
         if value.shape != shape:
-            msg = f"Value must have shape {shape}, not {value.shape}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.shape}))
         return None
     return checker
 numpy_shape = Validator(
@@ -684,15 +707,16 @@ numpy_shape = Validator(
     "validators",
     "check_numpy_shape",
     docstring_description="has shape `{0}`",
-    parameters=[Parameter("shape", "shape", "tuple[int]", "The correct shape")],
+    parameters=[Parameter("shape", "shape", "int | tuple[int]", "The correct shape")],
     add_func=check_numpy_shape,
 )
 
 def check_numpy_dtype(dtype):
+    template = "Value must have dtype {dtype}, not {{found}}".format_map({"dtype": dtype})
+
     def checker(value):
         if value.dtype != dtype:
-            msg = f"Value must have dtype {dtype}, not {value.dtype}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": value.dtype}))
         return None
     return checker
 numpy_dtype = Validator(
@@ -721,20 +745,19 @@ numpy_subdtype = Validator(
 )
 
 def check_numpy(dims, shape, dtype):
+    if isinstance(shape, int):
+        shape = (shape,)
+
     def checker(value):
-        nonlocal shape
+        if value.ndim == dims and value.shape == shape and value.dtype == dtype:
+            return None
         if value.ndim != dims:
             msg = f"Value must have {dims} dimensions, not {value.ndim}"
-            return ValueError(msg)
-        if isinstance(shape, int):
-            shape = (shape,)
-        if value.shape != shape:
+        elif value.shape != shape:
             msg = f"Value must have shape {shape}, not {value.shape}"
-            return ValueError(msg)
-        if value.dtype != dtype:
+        else:
             msg = f"Value must have dtype {dtype}, not {value.dtype}"
-            return ValueError(msg)
-        return None
+        return ValueError(msg)
     return checker
 numpy_dim_shape_dtype = Validator(
     "numpy",
@@ -751,9 +774,17 @@ numpy_dim_shape_dtype = Validator(
 
 
 # Paths
+# A single `stat` call per check, `os.path.exists`, `isdir` and `isfile` also catch `ValueError` for invalid paths
+def _stat_or_none(path):
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+VALIDATOR_FUNCS["_stat_or_none"] = _source_of(_stat_or_none)
+
 def check_path():
     def checker(value):
-        if not os.path.exists(value):
+        if _stat_or_none(value) is None:
             msg = f"Path `{value}` does not exist"
             return ValueError(msg)
         return None
@@ -768,7 +799,8 @@ path_val = Validator(
 
 def check_dir():
     def checker(value):
-        if not os.path.isdir(value):
+        result = _stat_or_none(value)
+        if result is None or not stat.S_ISDIR(result.st_mode):
             msg = f"Path `{value}` is not a directory"
             return ValueError(msg)
         return None
@@ -783,7 +815,8 @@ dir_val = Validator(
 
 def check_file():
     def checker(value):
-        if not os.path.isfile(value):
+        result = _stat_or_none(value)
+        if result is None or not stat.S_ISREG(result.st_mode):
             msg = f"Path `{value}` is not a file"
             return ValueError(msg)
         return None
@@ -799,10 +832,11 @@ file_val = Validator(
 
 # Miscellaneous
 def check_len(length):
+    template = "Length must be {length}, not {{found}}".format_map({"length": length})
+
     def checker(value):
         if len(value) != length:
-            msg = f"Length must be {length}, not {len(value)}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": len(value)}))
         return None
     return checker
 length = Validator(
@@ -815,10 +849,13 @@ length = Validator(
 )
 
 def check_lens(min_length, max_length):
+    template = "Length must be between {min_length} and {max_length}, not {{found}}".format_map(
+        {"min_length": min_length, "max_length": max_length},
+    )
+
     def checker(value):
         if not min_length <= len(value) <= max_length:
-            msg = f"Length must be between {min_length} and {max_length}, not {len(value)}"
-            return ValueError(msg)
+            return ValueError(template.format_map({"found": len(value)}))
         return None
     return checker
 lengths = Validator(
@@ -865,24 +902,31 @@ contains = Validator(
 
 
 def check_sorted():
-    def checker(value):
-        def value_error(wrong):
-            return ValueError(
-                f"Value must be sorted, goes wrong at index{'es' if len(wrong) > 1 else ''} {wrong}",
-            )
+    def value_error(wrong):
+        return ValueError(
+            f"Value must be sorted, goes wrong at index{'es' if len(wrong) > 1 else ''} {wrong}",
+        )
 
-        if HAS_NUMPY:  # noqa: F821
-            if isinstance(value, np.ndarray):  # noqa: F821
-                values = value[:-1] <= value[1:]
-                if not np.all(values):  # noqa: F821
-                    wrong = np.argwhere(~values)[:, 0]  # noqa: F821
-                    return value_error(wrong)
-        elif all(value[i] <= value[i + 1] for i in range(len(value) - 1)):
-            wrong = [i for i in range(len(value) - 1) if value[i] > value[i + 1]]
+    def sequence_checker(value):
+        wrong = [i for i in range(len(value) - 1) if not value[i] <= value[i + 1]]
+        if wrong:
             return value_error(wrong)
         return None
 
-    return checker
+    # Whether numpy is available is known when the checker is made, so only check for arrays when it is
+    if not HAS_NUMPY:  # noqa: F821
+        return sequence_checker
+
+    def array_checker(value):
+        if not isinstance(value, np.ndarray):  # noqa: F821
+            return sequence_checker(value)
+        in_order = value[:-1] <= value[1:]
+        if in_order.all():
+            return None
+        wrong = np.nonzero(~in_order)[0]  # noqa: F821
+        return value_error(wrong)
+
+    return array_checker
 
 
 sorted_val = Validator(
@@ -911,10 +955,8 @@ def write_validators(file_handle, validators: Iterable[Validator], prefix=""):
 
 
 def write_validator_name(file_handle, validators: Iterable[Validator], name: str):
-    validators = [validator.copy() for validator in validators]
-    validators[0].name = name
-    for i in range(1, len(validators)):
-        validators[i].name = ""
+    first, *others = validators
+    validators = [replace(first, name=name)] + [replace(validator, name="") for validator in others]
     file_handle.write(make_checker(validators))
 
 
@@ -940,107 +982,117 @@ def write_funcs(file_handle):
 path = pathlib.Path(os.path.realpath(__file__)).parent
 stub_loc = os.path.join(path, "_base_checker_stub.py")
 out_loc = os.path.join(path.parent, "_base_checker.py")
-stub_str = shutil.copy(stub_loc, out_loc)
-with open(out_loc, "a") as file:
-    # Default
-    # write_validators(file, [default])
-    # make_combinations(file, [default], types.values())
-
-    # Numeric
-    make_combinations(
-        file,
-        numbers.values(),
-        larger_values + less_values + [in_range, between],
+
+# All generated code is collected in memory and written, after the stub, to the file at once
+buf = io.StringIO()
+# Default
+# write_validators(buf, [default])
+# make_combinations(buf, [default], types.values())
+
+# Numeric
+make_combinations(
+    buf,
+    numbers.values(),
+    larger_values + less_values + [in_range, between],
+)
+make_combinations(buf, [positive, negative], numbers.values())
+for validator in larger_values + less_values + [in_range, between, positive, negative]:
+    write_validator_name(buf, [numbers["number"], validator], name=validator.name)
+for validator in [even, odd]:
+    write_validator_name(buf, [numbers["integer"], validator], name=validator.name)
+
+# Types
+write_validators(buf, [contains, non_zero, length, lengths, sorted_val])
+write_validators(buf, types.values(), prefix="is_")
+write_validators(buf, abcs.values(), prefix="is_")
+for container in [types["list"], types["tuple"], abcs["Sequence"]]:
+    write_validator_name(
+        buf,
+        [container, contains_type],
+        name=f"{container.name}_of",
     )
-    make_combinations(file, [positive, negative], numbers.values())
-    for validator in larger_values + less_values + [in_range, between, positive, negative]:
-        write_validator_name(file, [numbers["number"], validator], name=validator.name)
-    for validator in [even, odd]:
-        write_validator_name(file, [numbers["integer"], validator], name=validator.name)
-
-    # Types
-    write_validators(file, [contains, non_zero, length, lengths, sorted_val])
-    write_validators(file, types.values(), prefix="is_")
-    write_validators(file, abcs.values(), prefix="is_")
-    for container in [types["list"], types["tuple"], abcs["Sequence"]]:
+    for type_ in types.values():
+        name = type_.name
+        type_name = type_.function
+        replace_name = type_name.replace("(", "").replace(")", "").replace(", ", "` or `").replace(",", "")
+
+        validator = contains_type.fill_parameter_in_function(
+            "type_",
+            type_name,
+            replace_name,
+        )
         write_validator_name(
-            file,
-            [container, contains_type],
-            name=f"{container.name}_of",
+            buf,
+            [container, validator],
+            name=f"{container.name}_of_{name}",
         )
-        for type_ in types.values():
-            name = type_.name
-            type_name = type_.function
-            replace_name = type_name.replace("(", "").replace(")", "").replace(", ", "` or `").replace(",", "")
-
-            validator = contains_type.fill_parameter_in_function(
-                "type_",
-                type_name,
-                replace_name,
-            )
-            write_validator_name(
-                file,
-                [container, validator],
-                name=f"{container.name}_of_{name}",
-            )
 
-    # Has
-    write_validators(file, [has_attr, has_method, has_property])
+# Has
+write_validators(buf, [has_attr, has_method, has_property])
+
+# Strings
+write_validator_name(buf, [types["str"], starts_with], name="starts_with")
+write_validator_name(buf, [types["str"], ends_with], name="ends_with")
+
+# Numpy
+for name, validator in (
+    ("numpy_dim", numpy_dims),
+    ("numpy_shape", numpy_shape),
+    ("numpy_dtype", numpy_dtype),
+    ("numpy_subdtype", numpy_subdtype),
+):
+    write_validator_name(buf, [numpy_array, validator], name=name)
+
+# Sequence length
+for validator in [abcs["Sequence"], types["list"], types["tuple"], numpy_array]:
+    write_validator_name(
+        buf,
+        [validator, length],
+        name=f"{validator.name}_of_length",
+    )
+    write_validator_name(
+        buf,
+        [validator, lengths],
+        name=f"{validator.name}_between_lengths",
+    )
+
+# Paths
+write_validators(buf, [path_val, dir_val, file_val], prefix="is_")
 
-    # Strings
-    write_validator_name(file, [types["str"], starts_with], name="starts_with")
-    write_validator_name(file, [types["str"], ends_with], name="ends_with")
+# Numpy
+write_validator_name(buf, [numpy_array, numpy_dim_shape_dtype], name="numpy")
 
-    # Numpy
-    for name, validator in (
-        ("numpy_dim", numpy_dims),
-        ("numpy_shape", numpy_shape),
-        ("numpy_dtype", numpy_dtype),
-        ("numpy_subdtype", numpy_subdtype),
-    ):
-        write_validator_name(file, [numpy_array, validator], name=name)
+# Miscellaneous
+buf.write("\n\n")
+validator_funcs = [
+    contains_type,
+    non_zero,
+    even,
+    odd,
+    starts_with,
+    ends_with,
+    numpy_dims,
+    numpy_shape,
+    numpy_dtype,
+    numpy_dim_shape_dtype,
+    path_val,
+    dir_val,
+    file_val,
+    length,
+    lengths,
+    contains,
+    sorted_val,
+    numpy_subdtype,
+]
+write_funcs(buf)
 
-    # Sequence length
-    for validator in [abcs["Sequence"], types["list"], types["tuple"], numpy_array]:
-        write_validator_name(
-            file,
-            [validator, length],
-            name=f"{validator.name}_of_length",
-        )
-        write_validator_name(
-            file,
-            [validator, lengths],
-            name=f"{validator.name}_between_lengths",
-        )
+# Write to a temporary file first, so that an interrupted run does not leave a partially written module behind
+stub_str = pathlib.Path(stub_loc).read_text(encoding="utf-8")
+tmp_loc = out_loc + ".tmp"
+pathlib.Path(tmp_loc).write_text(stub_str + buf.getvalue(), encoding="utf-8")
+os.replace(tmp_loc, out_loc)
 
-    # Paths
-    write_validators(file, [path_val, dir_val, file_val], prefix="is_")
-
-    # Numpy
-    write_validator_name(file, [numpy_array, numpy_dim_shape_dtype], name="numpy")
-
-    # Miscellaneous
-    file.write("\n\n")
-    validator_funcs = [
-        contains_type,
-        non_zero,
-        even,
-        odd,
-        starts_with,
-        ends_with,
-        numpy_dims,
-        numpy_shape,
-        numpy_dtype,
-        numpy_dim_shape_dtype,
-        path_val,
-        dir_val,
-        file_val,
-        length,
-        lengths,
-        contains,
-        sorted_val,
-        numpy_subdtype,
-    ]
-    write_funcs(file)
+# Compile the generated module now, so that the first import does not have to
+py_compile.compile(out_loc, doraise=True)
 
 # %%
@@ -2,8 +2,37 @@ from __future__ import annotations
 
 import collections  # noqa: F401
 import os  # noqa: F401
+import stat  # noqa: F401
 import warnings
+import weakref
 from collections.abc import Callable
+# The ABCs used by the generated checkers, aliased so that they are not exported
+from collections.abc import (  # noqa: F401
+    AsyncGenerator as _AsyncGenerator,
+    AsyncIterable as _AsyncIterable,
+    AsyncIterator as _AsyncIterator,
+    Awaitable as _Awaitable,
+    Buffer as _Buffer,
+    Callable as _Callable,
+    Collection as _Collection,
+    Container as _Container,
+    Coroutine as _Coroutine,
+    Generator as _Generator,
+    Hashable as _Hashable,
+    ItemsView as _ItemsView,
+    Iterable as _Iterable,
+    KeysView as _KeysView,
+    Mapping as _Mapping,
+    MappingView as _MappingView,
+    MutableMapping as _MutableMapping,
+    MutableSequence as _MutableSequence,
+    MutableSet as _MutableSet,
+    Reversible as _Reversible,
+    Sequence as _Sequence,
+    Set as _Set,
+    Sized as _Sized,
+    ValuesView as _ValuesView,
+)
 from typing import Self
 
 try:
@@ -19,8 +48,176 @@ from ._no_val import NoValue  # noqa
 from .number_line import NumberLine  # noqa
 from ._validator_error import ValidatorError  # noqa
 
+# Checkers which may be shared, keyed on their full configuration. The values are weak references, so checkers
+# which are no longer used are not kept.
+_CHECKER_CACHE = weakref.WeakValueDictionary()
+
+# Types of the defaults and literals for which equal values are interchangeable, so checkers using them can be
+# shared
+_SHAREABLE_TYPES = frozenset((int, float, str, bytes, bool, type(None)))
+
+
+def _share_key(value):
+    """
+    Get the key of a default or literal for sharing checkers, or None if checkers using `value` cannot be shared.
+
+    Values compare equal across types (`1 == 1.0 == True`) and `0.0 == -0.0`, so only `NoValue` and scalars of the
+    exact types above are shared, keyed on their type. Containers are not shared, since their items have the same
+    problem.
+    """
+    if value is NoValue:
+        return value
+    if type(value) not in _SHAREABLE_TYPES or (type(value) is float and value == 0):
+        return None
+    return type(value), value
+
+
+# Bits of `BaseChecker._mask`, set when the corresponding check is configured
+_MASK_TYPES = 1
+_MASK_LITERALS = 2
+_MASK_NUMBER_LINE = 4
+_MASK_VALIDATORS = 8
+
+# Factories of the specialised validation functions, per `_mask`
+_SPECIALIZER_FACTORIES = {}
+
+
+def _specializer_factory(mask):
+    """
+    Return a factory for a validation function which only does the checks in `mask`.
+
+    The function only determines whether the value is valid, when it is not, `BaseChecker._validate` is called to
+    collect all the errors. The validators are called last, so that they are not called twice.
+    """
+    if mask in _SPECIALIZER_FACTORIES:
+        return _SPECIALIZER_FACTORIES[mask]
+
+    lines = [
+        "def factory(types, literals, literals_set, number_line, validators):",
+        "    def specialized(checker, value, name):",
+    ]
+    if mask & _MASK_TYPES:
+        lines += [
+            "        if not isinstance(value, types):",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_LITERALS:
+        # `literals_set` is None when a literal is unhashable, like in `BaseChecker._check_literal`
+        lines += [
+            "        if literals_set is None:",
+            "            found = value in literals",
+            "        else:",
+            "            try:",
+            "                found = value in literals_set",
+            "            except TypeError:",
+            "                # Unhashable values can still equal one of the literals",
+            "                found = value in literals",
+            "        if not found:",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_NUMBER_LINE:
+        lines += [
+            "        if not number_line.check(value):",
+            "            return checker._validate(value, name)",
+        ]
+    if mask & _MASK_VALIDATORS:
+        lines += [
+            "        val_err = checker._check_validators(value)",
+            "        if val_err is not None:",
+            "            msg = f'{name} has incorrect value: {value}'",
+            "            raise ValidatorError(msg, (val_err,))",
+        ]
+    lines += [
+        "        return None",
+        "    return specialized",
+    ]
+    namespace = {"ValidatorError": ValidatorError}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    _SPECIALIZER_FACTORIES[mask] = namespace["factory"]
+    return namespace["factory"]
+
+
+def _unspecialized(checker, value, name):
+    checker._validate(value, name)
+
+
+def _add_singleton(a, b, name):
+    """Combine two values of which at most one may be set, as done by `BaseChecker.__add__`."""
+    if a is not NoValue:
+        if b is not NoValue:
+            msg = f"Cannot add two {name}"
+            raise ValueError(msg)
+        return a
+    return b
+
 
 class BaseChecker:
+    __slots__ = (
+        "_default",
+        "_default_mutable",
+        "_default_factory",
+        "_number_line",
+        "_literals",
+        "_literals_set",
+        "_types",
+        "_converter",
+        "_validators",
+        "_replace_none",
+        "_configuration",
+        "_dirty",
+        "_mask",
+        "_specialized",
+        "__weakref__",
+    )
+
+    # Whether identically configured instances may be shared. Only enable this for subclasses which do not store any
+    # state on the instance besides the configuration.
+    _share_instances = False
+
+    def __new__(
+        cls,
+        default=NoValue,
+        default_factory=NoValue,
+        number_line=NoValue,
+        literals=NoValue,
+        types=NoValue,
+        converter=NoValue,
+        validators=NoValue,
+        replace_none=False,
+    ):
+        if not cls._share_instances:
+            return super().__new__(cls)
+
+        default_key = _share_key(default)
+        if isinstance(literals, tuple):
+            literals_key = tuple(map(_share_key, literals))
+            shareable_literals = None not in literals_key
+        else:
+            literals_key = _share_key(literals)
+            shareable_literals = literals_key is not None
+        if default_key is None or not shareable_literals:
+            return super().__new__(cls)
+        key = (
+            cls,
+            default_key,
+            default_factory,
+            number_line,
+            literals_key,
+            types,
+            converter,
+            validators,
+            replace_none,
+        )
+        try:
+            instance = _CHECKER_CACHE.get(key)
+        except TypeError:
+            # Unhashable configuration, such as a mutable default, cannot be shared
+            return super().__new__(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            _CHECKER_CACHE[key] = instance
+        return instance
+
     def __init__(
         self,
         default=NoValue,
@@ -65,6 +262,9 @@ class BaseChecker:
             If both `default` and `default_factory` are provided, or if `literals`, `types`, or `validators` are not
             tuples or the correct type, or if `number_line` is empty.
         """
+        if self._share_instances and getattr(self, "_mask", None) is not None:
+            # A shared instance returned by `__new__`, which already has this configuration
+            return
 
         def check_tuple(value, type_, name) -> tuple:
             if (not isinstance(value, tuple)) and (value is not NoValue):
@@ -83,92 +283,135 @@ class BaseChecker:
         if not isinstance(literals, tuple | type(NoValue)):
             literals = (literals,)
 
-        if not hasattr(default, "__hash__"):
-            try:
-                default.copy()
-            except AttributeError as e:
-                msg = "If default is mutable (ie. doesn't have an hash), it must have a `copy` method"
-                raise ValueError(msg) from e
+        # Mutable objects, such as lists, set `__hash__` to None
+        default_mutable = getattr(default, "__hash__", None) is None
+        if default_mutable and not callable(getattr(default, "copy", None)):
+            msg = "If default is mutable (ie. doesn't have an hash), it must have a `copy` method"
+            raise ValueError(msg)
 
         self._default = default
+        self._default_mutable = default_mutable
         self._default_factory = check_type(default_factory, Callable, "default_factory")
         if (default is not NoValue) and (default_factory is not NoValue):
             msg = "Cannot use both `default` and `default_factory`"
             raise ValueError(msg)
         self._number_line = check_type(number_line, NumberLine, "number_line")
         self._literals = check_type(literals, tuple, "literals")
+        # Set by `_update` when all literals are hashable, for faster membership checks
+        self._literals_set = None
         self._types = check_tuple(types, type, "types")
         self._converter = check_type(converter, Callable, "converter")
         self._validators = check_tuple(validators, Callable, "validators")
         self._replace_none = replace_none
+        # The configuration as given, since `_update` normalises the attributes above in place. Combining checkers
+        # must not depend on whether (a shared instance of) a checker has been used.
+        self._configuration = (
+            self._default,
+            self._default_factory,
+            self._number_line,
+            self._literals,
+            self._types,
+            self._converter,
+            self._validators,
+            self._replace_none,
+        )
+        self._mask = (
+            (_MASK_TYPES if self._types is not NoValue else 0)
+            | (_MASK_LITERALS if self._literals is not NoValue else 0)
+            | (_MASK_NUMBER_LINE if self._number_line is not NoValue else 0)
+            | (_MASK_VALIDATORS if self._validators is not NoValue else 0)
+        )
+        # Whether the configuration still has to be normalised by `_update`
+        self._dirty = True
+        # Validation function specialised to the configuration by `_update`, called as `func(self, value, name)`
+        self._specialized = _unspecialized
 
     def _update(self):
+        if not self._dirty:
+            return
+        # The warnings are emitted together at the end, with a single call to `warnings.warn`
+        pending_warnings = []
         if (self._number_line is not NoValue) and (not self._number_line):
             msg = "Number line is empty"
             raise ValueError(msg)
         if self._literals is not NoValue:
-            # To keep the order of the literals, we need to do it this way instead of using a set
-            self._literals = tuple(
-                self._literals[i] for i in range(len(self._literals)) if self._literals[i] not in self._literals[:i]
-            )
+            # A dict keeps the order of the literals, unlike a set
+            try:
+                self._literals = tuple(dict.fromkeys(self._literals))
+            except TypeError:
+                # Unhashable literals can only be compared by equality
+                self._literals = tuple(
+                    self._literals[i] for i in range(len(self._literals)) if self._literals[i] not in self._literals[:i]
+                )
             if not self._literals:
                 msg = "Literals are empty"
                 raise ValueError(msg)
         if self._types is not NoValue:
-            self._types = tuple(set(self._types))
+            # Unlike a set, a dict keeps the order in which the types were given
+            self._types = tuple(dict.fromkeys(self._types))
             if not self._types:
                 msg = "Types are empty"
                 raise ValueError(msg)
 
             if self._literals is not NoValue:
+                types = self._types
                 old_len = len(self._literals)
-                self._literals = tuple(literal for literal in self._literals if isinstance(literal, self._types))
+                self._literals = tuple(literal for literal in self._literals if isinstance(literal, types))
                 if not self._literals:
                     msg = "No literals are of the required type"
                     raise ValueError(msg)
                 if len(self._literals) != old_len:
-                    warnings.warn(
+                    pending_warnings.append(
                         "Some literals are not of the required type, they are removed from `literals`",
                     )
 
                 old_len = len(self._types)
-                self._types = tuple(t for t in self._types if any(isinstance(literal, t) for literal in self._literals))
+                literal_types = {type(literal) for literal in self._literals}
+                self._types = tuple(t for t in types if any(issubclass(lt, t) for lt in literal_types))
                 if old_len != len(self._types):
-                    warnings.warn(
+                    pending_warnings.append(
                         "Some types are not present in `literals`, they are removed from `types`",
                     )
 
             if (self._number_line is not NoValue) and (int not in self._types) and (float not in self._types):
                 self._number_line = NoValue
-                warnings.warn(
-                    "number_line` is not used because `types` does not contain `int` or `float`",
+                self._mask &= ~_MASK_NUMBER_LINE
+                pending_warnings.append(
+                    "`number_line` is not used because `types` does not contain `int` or `float`",
                 )
 
+        if self._literals is not NoValue:
+            try:
+                self._literals_set = frozenset(self._literals)
+            except TypeError:
+                self._literals_set = None
+
+        self._specialized = _specializer_factory(self._mask)(
+            self._types, self._literals, self._literals_set, self._number_line, self._validators,
+        )
+        self._dirty = False
+        if pending_warnings:
+            warnings.warn("\n".join(pending_warnings), stacklevel=3)
+
     def __add__(self, other: Self) -> Self:
         if not isinstance(other, self.__class__):
             msg = f"Cannot add {type(other)} to {self.__class__}"
             raise TypeError(msg)
 
-        def add_values(a, b, name):
-            if a is not NoValue:
-                if b is not NoValue:
-                    msg = f"Cannot add two {name}"
-                    raise ValueError(msg)
-                result = a
-            else:
-                result = b
-            return result
-
-        default = add_values(self._default, other._default, "default values")
-        converter = add_values(self._converter, other._converter, "converters")
-        default_factory = add_values( self._default_factory, other._default_factory, "default factories")
+        # The (own, other) pair of each setting, as configured
+        default, default_factory, number_line, literals, types, converter, validators, replace_none = zip(
+            self._configuration, other._configuration, strict=True,
+        )
+        default = _add_singleton(*default, "default values")
+        converter = _add_singleton(*converter, "converters")
+        default_factory = _add_singleton(*default_factory, "default factories")
 
         # Tuples can be added together directly
-        validators = self._validators + other._validators
-        number_line = self._number_line + other._number_line
-        literals = self._literals + other._literals
-        types = self._types + other._types
-        replace_none = self._replace_none or other._replace_none
+        validators = validators[0] + validators[1]
+        number_line = number_line[0] + number_line[1]
+        literals = literals[0] + literals[1]
+        types = types[0] + types[1]
+        replace_none = replace_none[0] or replace_none[1]
 
         return self.__class__(
             default=default,
@@ -182,63 +425,67 @@ class BaseChecker:
         )
 
     def _check_type(self, value):
-        if self._types is not NoValue:
-            for t in self._types:
-                if isinstance(value, t):
-                    break
+        # `_types` is already a tuple, which `isinstance` accepts directly
+        if self._mask & _MASK_TYPES and not isinstance(value, self._types):
+            if len(self._types) == 1:
+                msg = f"Value ({value}) must be of type {self._types[0].__name__}, found {type(value).__name__}"
             else:
-                if len(self._types) == 1:
-                    msg = f"Value ({value}) must be of type {self._types[0].__name__}, found {type(value).__name__}"
-                else:
-                    msg = (f"Value ({value}) must be one of the following types: "
-                           f"{self._tuple_str([t.__name__ for t in self._types])}, found {type(value).__name__}")
-                return TypeError(msg)
+                names = ", ".join(repr(t.__name__) for t in self._types)
+                msg = f"Value ({value}) must be one of the following types: ({names}), found {type(value).__name__}"
+            return TypeError(msg)
         return None
 
     def _check_literal(self, value):
-        if (self._literals is not NoValue) and (value not in self._literals):
+        if not self._mask & _MASK_LITERALS:
+            return None
+        if self._literals_set is not None:
+            try:
+                found = value in self._literals_set
+            except TypeError:
+                # Unhashable values can still equal one of the literals
+                found = value in self._literals
+        else:
+            found = value in self._literals
+        if not found:
             msg = f"Value ({value}) must be one of the following: {self._tuple_str(self._literals)}"
             return ValueError(msg)
         return None
 
     def _check_number_line(self, value):
-        if self._number_line is not NoValue:
+        if self._mask & _MASK_NUMBER_LINE:
             return self._number_line.return_raise_check(value)
         return None
 
     def _check_validators(self, value):
-        if self._validators is not NoValue:
-            errors = []
+        if self._mask & _MASK_VALIDATORS:
+            # Only allocated when a validator fails
+            errors = None
             for validator in self._validators:
                 try:
                     message = validator(value)
                 except BaseException as e:  # noqa: BLE001
                     msg = f"Validator named {validator.__name__} raised an exception: {e}"
-                    errors.append(ValueError(msg))
-                else:
-                    if isinstance(message, Exception):
-                        errors.append(message)
+                    message = ValueError(msg)
+                if isinstance(message, Exception):
+                    if errors is None:
+                        errors = []
+                    errors.append(message)
             if errors:
                 return ValidatorError("Value did not pass all validators", errors)
         return None
 
     def _validate(self, value, name):
-        errs = []
+        if not self._mask:
+            return
         type_err = self._check_type(value)
         lit_err = self._check_literal(value)
         num_err = self._check_number_line(value)
         val_err = self._check_validators(value)
-        if type_err:
-            errs.append(type_err)
-        if lit_err:
-            errs.append(lit_err)
-        if num_err:
-            errs.append(num_err)
-        if val_err:
-            errs.append(val_err)
-        if errs:
-            msg = f"{name} has incorrect value: {value}"
-            raise ValidatorError(msg, errs)
+        if type_err is None and lit_err is None and num_err is None and val_err is None:
+            return
+        errs = tuple(err for err in (type_err, lit_err, num_err, val_err) if err is not None)
+        msg = f"{name} has incorrect value: {value}"
+        raise ValidatorError(msg, errs)
 
     @staticmethod
     def _tuple_str(values):
@@ -256,10 +503,9 @@ class BaseChecker:
     def _get_default(self):
         if self._default is NoValue:
             return self._default_factory() if self._default_factory is not NoValue else NoValue
-        if not hasattr(self._default, "__hash__"):
+        if self._default_mutable:
             return self._default.copy()
-        else:
-            return self._default
+        return self._default
 
     @staticmethod
     def _invert(func):
@@ -7,6 +7,8 @@ from ._no_val import NoValue
 
 
 class Descriptor(BaseChecker):
+    __slots__ = ("owner", "name", "private_name")
+
     def __set_name__(self, owner, name):
         # Checking is done here, since this is called when all the descriptors are added together. This results in a
         # slightly strange error message, which states that the error was raised while calling __set_name__.
@@ -42,10 +44,10 @@ class Descriptor(BaseChecker):
             if value is NoValue:
                 msg = f"No value given and no default value for `{self.name}`"
                 raise ValueError(msg)
-            self._validate(value, f"default value for `{self.name}`")
+            self._specialized(self, value, f"default value for `{self.name}`")
         else:
             if self._converter is not NoValue:
                 value = self._converter(value)
-            self._validate(value, self.name)
+            self._specialized(self, value, self.name)
         setattr(instance, self.private_name, value)
         return None
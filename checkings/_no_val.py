@@ -38,5 +38,9 @@ class NoVal:
     def __str__(self):
         return "NoValue"
 
+    def __reduce__(self):
+        # Copies and unpickled values must be the `NoValue` singleton, since it is compared by identity
+        return "NoValue"
+
 
 NoValue = NoVal()
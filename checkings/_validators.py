@@ -1,5 +1,5 @@
 import inspect
-from typing import ParamSpec, TypeVar
+from typing import ParamSpec, Self, TypeVar
 
 from ._base_checker import BaseChecker
 from ._no_val import NoValue
@@ -41,6 +41,47 @@ def _calc_new_signature(old_func):
     return old_sig.replace(parameters=params)
 
 
+_PARAM_DOCS = inspect.cleandoc(
+    """
+    value: Optional[Any]
+        The value to be validated, used for the direct call to the validator
+    name: Optional[str]
+        The name of the parameter to be validated, used for the direct call to the validator. This is used to 
+        provide a more informative error message.
+    """,
+)
+
+_NOTES = inspect.cleandoc(
+    """
+    This function can be called directly by combining the parameters of the function and the call to 
+    the validator. It assumes that both are called directly when either the number of arguments is 
+    greater than the number of parameters for the function or when the `name` and/or `value` keyword 
+    argument are used.
+    """,
+)
+
+
+def _add_to_docs(docs, name, value):
+    """Add `value` to the end of the `name` section of `docs`, or add the section if it does not exist."""
+    parameters_start = False
+    split_docs = docs.split("\n")
+
+    for index, line in enumerate(split_docs):
+        if line.startswith(name):
+            parameters_start = True
+        if parameters_start and split_docs[index - 1] != name and line.startswith("---"):
+            index -= 1
+            break
+    else:
+        index += 1
+
+    if parameters_start:
+        before = "\n".join(split_docs[:index])
+        after = "" if index == len(split_docs) else "\n".join(split_docs[index:])
+        return before + "\n" + value + "\n" + after
+    return docs + f"\n{name}\n-----\n{value}\n"
+
+
 class _DirectCallMeta(type):
     """
     Metaclass that allows the Validator generator functions to be called directly with two extra parameters to directly
@@ -50,54 +91,13 @@ class _DirectCallMeta(type):
         new_class = super().__new__(cls, name, bases, dct)
         _attributes = [a for a in dir(new_class) if not a.startswith("_") and callable(getattr(new_class, a))]
         for a in _attributes:
-            docs = inspect.cleandoc(getattr(new_class, a).__doc__)
-            new_sig = _calc_new_signature(getattr(new_class, a))
-
-            setattr(new_class, a, _DirectCallMeta._combine_call(getattr(new_class, a), new_sig))
+            func = getattr(new_class, a)
+            docs = inspect.cleandoc(func.__doc__ or "")
+            new_func = _DirectCallMeta._combine_call(func, _calc_new_signature(func))
+            setattr(new_class, a, new_func)
 
-            if docs is None:
-                docs = ""
-
-            def add_to_docs(docs, name, value):
-                parameters_start = False
-                split_docs = docs.split("\n")
-
-                for index, line in enumerate(split_docs):
-                    if line.startswith(name):
-                        parameters_start = True
-                    if parameters_start and split_docs[index - 1] != name and line.startswith("---"):
-                        index -= 1
-                        break
-                else:
-                    index += 1
-
-                if parameters_start:
-                    before = "\n".join(split_docs[:index])
-                    after = "" if index == len(split_docs) else "\n".join(split_docs[index:])
-                    new_docs = before + "\n" + inspect.cleandoc(value) + "\n" + after
-
-                else:
-                    new_docs = docs + f"\n{name}\n-----\n{inspect.cleandoc(value)}\n"
-                return new_docs
-
-            param_docs = """
-            value: Optional[Any]
-                The value to be validated, used for the direct call to the validator
-            name: Optional[str]
-                The name of the parameter to be validated, used for the direct call to the validator. This is used to 
-                provide a more informative error message.
-            """
-
-            notes = """
-            This function can be called directly by combining the parameters of the function and the call to 
-            the validator. It assumes that both are called directly when either the number of arguments is 
-            greater than the number of parameters for the function or when the `name` and/or `value` keyword 
-            argument are used.
-            """
-            docs = add_to_docs(docs, "Parameters", param_docs)
-            docs = add_to_docs(docs, "Notes", notes)
-
-            getattr(new_class, a).__doc__ = docs
+            docs = _add_to_docs(docs, "Parameters", _PARAM_DOCS)
+            new_func.__doc__ = _add_to_docs(docs, "Notes", _NOTES)
 
         return new_class
 
@@ -116,6 +116,11 @@ class _DirectCallMeta(type):
             callable | None
         """
         def call(*args, **kwargs):
+            # `name` and `value` are keyword-only, so without them this is a normal call to the generator function,
+            # which does not need the (slow) signature binding.
+            if "name" not in kwargs and "value" not in kwargs:
+                return func(*args, **kwargs)
+
             nonlocal new_signature
             bound = new_signature.bind(*args, **kwargs)
             bound.apply_defaults()
@@ -147,6 +152,20 @@ class _DirectCallMeta(type):
 
 
 class Validator(BaseChecker, metaclass=_DirectCallMeta):
+    __slots__ = ()
+    _share_instances = True
+
+    # Instances are shared and must not be changed, so a copy is the instance itself
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo) -> Self:
+        return self
+
+    def __reduce__(self):
+        # Rebuilt through the constructor, which returns the shared instance if there is one
+        return self.__class__, self._configuration
+
     def __call__(self, value: T, name: str) -> T:
         self._update()
         if value is NoValue or ((value is None) and self._replace_none):
@@ -157,5 +176,5 @@ class Validator(BaseChecker, metaclass=_DirectCallMeta):
             else:
                 msg = f"No value given and no default value for `{name}`"
                 raise ValueError(msg)
-        self._validate(value, name)
+        self._specialized(self, value, name)
         return value
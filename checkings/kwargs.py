@@ -3,7 +3,7 @@ from typing import Any
 from ._validators import Validator
 from ._validator_error import ValidatorError
 
-def default_kwargs(kwargs: dict[str, Any], defaults: Any) -> dict[str, Any]:
+def default_kwargs(kwargs: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
     """
     Fill in default values for missing keyword arguments.
 
@@ -25,9 +25,36 @@ def default_kwargs(kwargs: dict[str, Any], defaults: Any) -> dict[str, Any]:
     a mutable object, all the returned dictionaries will share the same object, which may lead to unexpected behavior.
     To avoid this, pass a copy of the mutable object as a default value.
     """
-    defaults = defaults.copy()
-    defaults.update(kwargs)
-    return defaults
+    return {**defaults, **kwargs}
+
+# Marks a missing key in `dict.get`, since the values may be `None`
+_MISSING = object()
+
+
+def _check_in_order(function_name, kwargs, key_type, defaults):
+    """Check `kwargs` key by key, raising the error for the first incorrect keyword argument."""
+    default_str = "default value of " if defaults else ""
+
+    for key, val in kwargs.items():
+        checker = key_type.get(key, _MISSING)
+        if checker is _MISSING:
+            msg = f"{function_name} got an unexpected {default_str[:-3]}keyword argument '{key}'"
+            raise TypeError(msg)
+        if isinstance(checker, Validator):
+            try:
+                checker(val, key)
+            except ValidatorError as e:
+                msg = f"Validation failed for {default_str}kwarg '{key}' of {function_name}"
+                raise ValueError(msg) from e
+        elif isinstance(checker, type):
+            if not isinstance(val, checker):
+                msg = (f"Expected type {checker.__name__} for {default_str}kwarg '{key}' of {function_name},"
+                       f" got {type(val).__name__}")
+                raise TypeError(msg)
+        else:
+            msg = f"Invalid type specification for kwarg '{key}' of {function_name}"
+            raise TypeError(msg)
+
 
 def check_kwargs(function_name, kwargs, key_type: dict[str, type | Validator], defaults=None):
     """
@@ -67,32 +94,9 @@ def check_kwargs(function_name, kwargs, key_type: dict[str, type | Validator], d
     a mutable object, all the returned dictionaries will share the same object, which may lead to unexpected behavior.
     To avoid this, pass a copy of the mutable object as a default value.
     """
-    def check(kwargs, key_type, defaults):
-        default_str = "default value of " if defaults else ""
-
-        for key, val in kwargs.items():
-            if key in key_type:
-                if isinstance(key_type[key], Validator):
-                    try:
-                        key_type[key](val, key)
-                    except ValidatorError as e:
-                        msg = f"Validation failed for {default_str}kwarg '{key}' of {function_name}"
-                        raise ValueError(msg) from e
-                elif isinstance(key_type[key], type):
-                    if not isinstance(val, key_type[key]):
-                        msg = (f"Expected type {key_type[key].__name__} for {default_str}kwarg '{key}' of {function_name},"
-                               f" got {type(val).__name__}")
-                        raise TypeError(msg)
-                else:
-                    msg = f"Invalid type specification for kwarg '{key}' of {function_name}"
-                    raise TypeError(msg)
-            else:
-                msg = f"{function_name} got an unexpected {default_str[:-3]}keyword argument '{key}'"
-                raise TypeError(msg)
-
-    check(kwargs, key_type, defaults=False)
+    _check_in_order(function_name, kwargs, key_type, defaults=False)
     if defaults is not None:
-        check(defaults, key_type, defaults=True)
+        _check_in_order(function_name, defaults, key_type, defaults=True)
     else:
         defaults = {}
     return default_kwargs(kwargs, defaults)
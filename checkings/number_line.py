@@ -1,13 +1,30 @@
 from __future__ import annotations
 
+import weakref
+from operator import attrgetter
 from typing import assert_never
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Bounds are immutable, so equal bounds can be shared. Values are weak, so unused bounds are not kept.
+_INTERNED_BOUNDS = weakref.WeakValueDictionary()
+
 
 class Bound:
+    __slots__ = ("value", "inclusive", "_hash", "lower_key", "upper_key", "__weakref__")
+
     value: float
     inclusive: bool
+    lower_key: tuple[float, bool]
+    upper_key: tuple[float, bool]
 
-    def __init__(self, value, inclusive):
+    def __new__(cls, value, inclusive):
         """
         Represent a bound.
 
@@ -18,6 +35,10 @@ class Bound:
         inclusive: bool
             Whether the bound is inclusive. If True, the bound is inclusive, if False, the bound is exclusive.
             When the bound is infinity or minus infinity, the bound is always stored as inclusive.
+        lower_key: tuple[float, bool]
+            Sort key of the bound used as a lower bound, the widest lower bound sorts first.
+        upper_key: tuple[float, bool]
+            Sort key of the bound used as an upper bound, the widest upper bound sorts last.
 
         Notes
         -----
@@ -31,11 +52,37 @@ class Bound:
         - A bound is neither bigger, smaller, nor equal to another bound, e.g. Bound(1, True) < Bound(1, False)
 
         When comparing a bound with a float, the float is considered an inclusive bound.
+
+        Equal bounds are shared, the bound should therefore not be modified.
         """
         if value == float("inf") or value == float("-inf"):
             inclusive = True
-        self.value = value
-        self.inclusive = inclusive
+
+        # The types are part of the key, since e.g. `1`, `1.0`, and `True` compare equal. Zero is not shared, since
+        # `0.0` and `-0.0` are equal but are shown differently.
+        key = (cls, type(value), value, type(inclusive), inclusive) if value else None
+        try:
+            bound = _INTERNED_BOUNDS.get(key)
+        except TypeError:
+            # Unhashable values cannot be shared
+            key = bound = None
+        if bound is not None:
+            return bound
+
+        bound = super().__new__(cls)
+        bound.value = value
+        bound.inclusive = inclusive
+        bound._hash = None
+        # With these keys, `min` and `max` give the bounds of the union of two ranges
+        bound.lower_key = (value, not inclusive)
+        bound.upper_key = (value, inclusive)
+        if key is not None:
+            _INTERNED_BOUNDS[key] = bound
+        return bound
+
+    def __reduce__(self):
+        # Copies and unpickled bounds are created by `__new__`, so that they are shared as well
+        return self.__class__, (self.value, self.inclusive)
 
     def smaller_or_eq(self, other) -> bool:
         """
@@ -83,6 +130,8 @@ class Bound:
         raise TypeError(msg)
 
     def __eq__(self, other: Bound | float) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Bound):
             return (self.value == other.value) and (self.inclusive == other.inclusive)
         if isinstance(other, (int, float)):
@@ -124,7 +173,9 @@ class Bound:
         """
         Return a hash of the bound. The hash is based on the value and inclusivity of the bound.
         """
-        return hash((self.value, self.inclusive))
+        if self._hash is None:
+            self._hash = hash((self.value, self.inclusive))
+        return self._hash
 
 
 MinusInfinity = Bound.minus_infinity()
@@ -132,6 +183,8 @@ Infinity = Bound.infinity()
 
 
 class Range:
+    __slots__ = ("lower", "upper", "_hash")
+
     def __init__(self, lower: Bound, upper: Bound, *, _check=True):
         """
         Represent a range of values.
@@ -143,6 +196,7 @@ class Range:
         """
         self.lower = lower
         self.upper = upper
+        self._hash = None
         if _check and not self.lower.smaller_or_eq(self.upper):
             msg = f"Lower bound ({self.lower.value}) cannot be bigger than upper bound ({self.upper.value})"
             raise ValueError(msg)
@@ -153,40 +207,24 @@ class Range:
             return NotImplemented
         return smaller and self.upper >= item
 
+    def _contains_number(self, value: float) -> bool:
+        """Check if the int or float `value` is in the range, without going through the `Bound` comparisons."""
+        lower = self.lower
+        upper = self.upper
+        return (lower.value < value or (lower.inclusive and lower.value == value)) and (
+            value < upper.value or (upper.inclusive and upper.value == value)
+        )
+
     def __bool__(self):
         return self.lower <= self.upper
 
     def __add__(self, other: Range) -> tuple[Range] | tuple[Range, Range]:
         if isinstance(other, Range):
-            if (
-                (self.lower.value > other.upper.value)
-                or (self.upper.value < other.lower.value)
-                or (
-                    self.lower.value == other.upper.value and (not self.lower.inclusive) and (not other.upper.inclusive)
-                )
-            ):
+            if _separated(self, other) or _separated(other, self):
                 return self, other
 
-            if self.lower.value < other.lower.value:
-                lower_bound = self.lower
-            elif self.lower.value > other.lower.value:
-                lower_bound = other.lower
-            else:
-                lower_bound = Bound(
-                    self.lower.value,
-                    self.lower.inclusive or other.lower.inclusive,
-                )
-
-            if self.upper.value > other.upper.value:
-                upper_bound = self.upper
-            elif self.upper.value < other.upper.value:
-                upper_bound = other.upper
-            else:
-                upper_bound = Bound(
-                    self.upper.value,
-                    self.upper.inclusive or other.upper.inclusive,
-                )
-
+            lower_bound = min(self.lower, other.lower, key=_LOWER_KEY)
+            upper_bound = max(self.upper, other.upper, key=_UPPER_KEY)
             return (Range(lower_bound, upper_bound),)
         return NotImplemented
 
@@ -204,15 +242,15 @@ class Range:
             if self.lower.smaller_or_eq(lower_bound) and self.upper.bigger_or_eq(
                 upper_bound,
             ):
-                return Range(self.lower, lower_bound), Range(upper_bound, self.upper)
+                return _non_empty((self.lower, lower_bound), (upper_bound, self.upper))
             if self.lower.smaller_or_eq(lower_bound) and self.upper.smaller_or_eq(
                 other.upper,
             ):
-                return (Range(self.lower, lower_bound),)
+                return _non_empty((self.lower, lower_bound))
             if self.lower.bigger_or_eq(other.lower) and self.upper.bigger_or_eq(
                 upper_bound,
             ):
-                return (Range(upper_bound, self.upper),)
+                return _non_empty((upper_bound, self.upper))
             if self.lower.bigger_or_eq(other.lower) and self.upper.smaller_or_eq(
                 other.upper,
             ):
@@ -222,10 +260,17 @@ class Range:
             return NotImplemented
 
     def __eq__(self, other: Range) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Range):
             return NotImplemented
         return self.lower == other.lower and self.upper == other.upper
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.lower, self.upper))
+        return self._hash
+
     def __repr__(self):
         return f"Range({self.lower}, {self.upper})"
 
@@ -261,10 +306,133 @@ class Range:
         return Range(MinusInfinity, Infinity, _check=False)
 
 
+_LOWER_KEY = attrgetter("lower_key")
+_UPPER_KEY = attrgetter("upper_key")
+
+
+def _non_empty(*pieces: tuple[Bound, Bound]) -> tuple[Range, ...]:
+    """Make ranges from the (lower, upper) bound pairs, skipping the pairs that contain no values."""
+    ranges = tuple(
+        Range(lower, upper, _check=False)
+        for lower, upper in pieces
+        if lower.value < upper.value or (lower.value == upper.value and lower.inclusive and upper.inclusive)
+    )
+    return ranges or (EmptyRange,)
+
+
+def _separated(first: Range, second: Range) -> bool:
+    """Check if `second` starts after `first` ends, with a gap between them, so that they cannot be combined."""
+    if first.upper.value == second.lower.value:
+        return not first.upper.inclusive and not second.lower.inclusive
+    return first.upper.value < second.lower.value
+
+
 EmptyRange = Range(Infinity, MinusInfinity, _check=False)
 FullRange = Range(MinusInfinity, Infinity)
 
 
+# Integers up to this size are exactly representable as a 64-bit float
+_FLOAT_EXACT_LIMIT = 2**53
+
+
+def _exact_as_float(value: float) -> bool:
+    return not isinstance(value, int) or -_FLOAT_EXACT_LIMIT <= value <= _FLOAT_EXACT_LIMIT
+
+
+class RangeSet:
+    __slots__ = ("lows", "low_inclusive", "highs", "high_inclusive")
+
+    def __init__(self, ranges: list[Range] | tuple[Range, ...] | Range):
+        """
+        Represent a collection of ranges, for checking many values at once. A value is in the set if it is in any of
+        the ranges.
+
+        The bounds are stored as numpy arrays, so that the membership of a value or an array of values is checked
+        with vectorized comparisons.
+
+        Parameters
+        ----------
+        ranges:
+            The ranges in the set.
+
+        Raises
+        ------
+        ImportError
+            If numpy is not installed.
+
+        Notes
+        -----
+        The bounds are stored as float64, unless one of them is an int which is not exactly representable as a float
+        (bigger than 2**53), then they are stored as Python objects. Integer values which are not exactly
+        representable are likewise compared as Python objects, so the comparisons are always exact, but slower for
+        these values.
+        """
+        if not HAS_NUMPY:
+            msg = "`RangeSet` requires numpy, install it with `pip install checkings[numpy]`"
+            raise ImportError(msg)
+        if isinstance(ranges, Range):
+            ranges = (ranges,)
+        lows = [range_.lower.value for range_ in ranges]
+        highs = [range_.upper.value for range_ in ranges]
+        dtype = np.float64 if all(map(_exact_as_float, lows + highs)) else object
+        self.lows = np.array(lows, dtype=dtype)
+        self.low_inclusive = np.array([range_.lower.inclusive for range_ in ranges], dtype=bool)
+        self.highs = np.array(highs, dtype=dtype)
+        self.high_inclusive = np.array([range_.upper.inclusive for range_ in ranges], dtype=bool)
+
+    def __len__(self):
+        return len(self.lows)
+
+    def __contains__(self, item: float) -> bool:
+        if not isinstance(item, (float, int)):
+            msg = f"Cannot check for type {type(item).__name__} in RangeSet, only int and float are allowed"
+            raise TypeError(msg)
+        return bool(self._in_ranges(self._as_array(item)).any())
+
+    def _as_array(self, values) -> np.ndarray:
+        """Convert `values` to an array which compares exactly with the bounds."""
+        values = np.asarray(values)
+        if values.dtype.kind not in "biufO":
+            msg = f"Cannot check for dtype {values.dtype} in RangeSet, only int and float are allowed"
+            raise TypeError(msg)
+        if (
+            values.dtype.kind in "iu"
+            and self.lows.dtype != object
+            and ((values > _FLOAT_EXACT_LIMIT) | (values < -_FLOAT_EXACT_LIMIT)).any()
+        ):
+            # Comparing with the float bounds would round these values
+            values = values.astype(object)
+        return values
+
+    def _in_ranges(self, values):
+        """Check for the values (broadcast against the ranges) whether they are in each of the ranges."""
+        return ((values > self.lows) | ((values == self.lows) & self.low_inclusive)) & (
+            (values < self.highs) | ((values == self.highs) & self.high_inclusive)
+        )
+
+    def contains_many(self, values) -> np.ndarray:
+        """
+        Check for each value whether it is in any of the ranges.
+
+        Parameters
+        ----------
+        values: array_like
+            The values to check.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array with the same shape as `values`.
+
+        Raises
+        ------
+        TypeError
+            If the values are not numbers.
+        """
+        values = self._as_array(values)
+        return self._in_ranges(values[..., np.newaxis]).any(axis=-1)
+
+
 class NumberLine:
     def __init__(self, ranges: list[Range] | Range = FullRange, simplify=True):
         """
@@ -331,11 +499,10 @@ class NumberLine:
         TypeError
             If the value is not an int or a float.
         """
-        contains = self.__contains__(value)
-        if contains is NotImplemented:
-            msg = f"Cannot check for type {type(value).__name__} in NumberLine, only int and float are allowed"
-            raise TypeError(msg)
-        return contains
+        if isinstance(value, (float, int)):
+            return self._contains_number(value)
+        msg = f"Cannot check for type {type(value).__name__} in NumberLine, only int and float are allowed"
+        raise TypeError(msg)
 
     contains = check
 
@@ -434,9 +601,17 @@ class NumberLine:
 
     def __contains__(self, value: float) -> bool | NotImplemented:
         if isinstance(value, (float, int)):
-            return any(value in _range for _range in self.ranges)
+            return self._contains_number(value)
         return NotImplemented
 
+    def _contains_number(self, value: float) -> bool:
+        """Check if the int or float `value` is in any of the ranges."""
+        # A plain loop, since `any` with a generator is slower for the few ranges of a typical number line
+        for _range in self.ranges:  # noqa: SIM110
+            if _range._contains_number(value):
+                return True
+        return False
+
     def __bool__(self) -> bool:
         self.simplify()
         return bool(self.ranges)
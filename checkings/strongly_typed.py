@@ -1,5 +1,9 @@
+import functools
 import inspect
-from typing import Callable
+from typing import Any, Callable
+
+# Default of the parameters of the generated wrappers, to know which arguments are passed
+_MISSING = object()
 
 def strongly_typed(func: Callable, strict: bool = False) -> Callable:
     """
@@ -31,14 +35,81 @@ def strongly_typed(func: Callable, strict: bool = False) -> Callable:
                 msg = f"Parameter '{param.name}' lacks a type annotation."
                 raise ValueError(msg)
 
-    def wrapper(*args, **kwargs):
-        bound_args = sig.bind(*args, **kwargs)
-        for name, value in bound_args.arguments.items():
-            if name in annotations:
-                expected_type = annotations[name]
-                if not isinstance(value, expected_type):
-                    msg = f"Argument '{name}' must be of type {expected_type.__name__}, got {type(value).__name__}"
-                    raise TypeError(msg)
-        return func(*args, **kwargs)
-
-    return wrapper
\ No newline at end of file
+    # Every value is an instance of `object`, and `Any` cannot be used with `isinstance`, so neither is checked
+    checked = {
+        name: annotation
+        for name, annotation in annotations.items()
+        if annotation is not Any and annotation is not object
+    }
+
+    def check(name, expected_type, value):
+        if not isinstance(value, expected_type):
+            msg = f"Argument '{name}' must be of type {expected_type.__name__}, got {type(value).__name__}"
+            raise TypeError(msg)
+
+    variadic = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    params = list(sig.parameters.values())
+    # The generated wrapper uses names starting with `__`, which therefore cannot be used by the parameters
+    if any(param.kind in variadic or param.name.startswith("__") for param in params):
+        # The annotated parameters as (name, type) pairs, in the order of the signature
+        annotated = tuple((param.name, checked[param.name]) for param in params if param.name in checked)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = sig.bind(*args, **kwargs).arguments
+            for name, expected_type in annotated:
+                if name in arguments:
+                    check(name, expected_type, arguments[name])
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return functools.wraps(func)(_make_wrapper(func, params, checked, check))
+
+
+def _make_wrapper(func, params, checked, check):
+    """
+    Generate a wrapper with the same parameters as `func`, which checks the types of the arguments and calls `func`.
+
+    Defaults are replaced by a sentinel, so that only arguments which are passed are checked, like with
+    `Signature.bind`.
+    """
+    namespace = {"__func": func, "__check": check, "__missing": _MISSING, "__isinstance": isinstance}
+    parameters = []
+    body = []
+    call_args = []
+    for index, param in enumerate(params):
+        if param.kind == inspect.Parameter.KEYWORD_ONLY and "*" not in parameters:
+            parameters.append("*")
+        name = param.name
+        has_default = param.default is not inspect.Parameter.empty
+        parameters.append(f"{name}=__missing" if has_default else name)
+
+        if name in checked:
+            namespace[f"__type_{index}"] = checked[name]
+            condition = f"not __isinstance({name}, __type_{index})"
+            if has_default:
+                condition = f"{name} is not __missing and {condition}"
+            body.append(f"    if {condition}:")
+            body.append(f"        __check({name!r}, __type_{index}, {name})")
+
+        value = name
+        if has_default:
+            namespace[f"__default_{index}"] = param.default
+            value = f"(__default_{index} if {name} is __missing else {name})"
+        call_args.append(f"{name}={value}" if param.kind == inspect.Parameter.KEYWORD_ONLY else value)
+
+        is_last_positional_only = param.kind == inspect.Parameter.POSITIONAL_ONLY and (
+            index + 1 == len(params) or params[index + 1].kind != inspect.Parameter.POSITIONAL_ONLY
+        )
+        if is_last_positional_only:
+            parameters.append("/")
+
+    source = "\n".join(
+        [f"def wrapper({', '.join(parameters)}):", *body, f"    return __func({', '.join(call_args)})"],
+    )
+    exec(source, namespace)  # noqa: S102
+    wrapper = namespace["wrapper"]
+    # Errors for missing or unexpected arguments are named after the code object, which should be that of `func`
+    wrapper.__code__ = wrapper.__code__.replace(co_name=func.__name__, co_qualname=func.__qualname__)
+    return wrapper
@@ -34,5 +34,13 @@ def test_descriptor():
     assert isinstance(e.value.exceptions[0], TypeError)
 
 
+def test_descriptor_slots():
+    descriptor = Descriptor.positive_float(include_zero=True)
+    assert not hasattr(descriptor, "__dict__")
+    with raises(AttributeError):
+        descriptor.unknown = 1
+
+
 if __name__ == "__main__":
-    test_descriptor()
\ No newline at end of file
+    test_descriptor()
+    test_descriptor_slots()
\ No newline at end of file
@@ -73,3 +73,9 @@ def test_check_kwargs():
     with raises(TypeError) as e:
         check_kwargs('some_function', {'a': 2, 'b': 'h'}, kwargs_checker3)
 
+
+    # Changes to `key_type` after it has been used are taken into account
+    kwargs_checker['c'] = float
+    check_kwargs('some_function', {'a': 2, 'c': 1.0}, kwargs_checker)
+    with raises(TypeError):
+        check_kwargs('some_function', {'a': 2, 'c': 1}, kwargs_checker)
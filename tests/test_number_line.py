@@ -1,79 +1,122 @@
+import copy
+import operator
+import pickle
 import sys
 
+from pytest import importorskip, mark, raises
+
 sys.path.append(".")  # Adjust the path to import from the parent directory
-from checkings.number_line import Bound, Range, EmptyRange
-
-
-def test():
-    range1 = Range(Bound(0, True), Bound(10, True))
-    range2 = Range(Bound(5, True), Bound(15, True))
-    range3 = Range(Bound(5, False), Bound(10, True))
-    range4 = Range(Bound(10, True), Bound(15, True))
-    range5 = Range(Bound(0, True), Bound(5, True))
-    range6 = Range(Bound(0, False), Bound(10, False))
-    range7 = Range(Bound(0, True), Bound(10, True))
-    range8 = Range(Bound(0, True), Bound(0, True))
-    range9 = Range(Bound(10, True), Bound(10, True))
-    range10 = Range(Bound(0, False), Bound(10, True))
-    range11 = Range(Bound(4, True), Bound(4, True))
+from checkings.number_line import Bound, NumberLine, Range, RangeSet, EmptyRange
+
+
+def make_range(lower, lower_inclusive, upper, upper_inclusive):
+    return Range(Bound(lower, lower_inclusive), Bound(upper, upper_inclusive))
+
+
+# Each case is (operator, left range, right range, expected result), the ranges are given as
+# (lower, lower inclusive, upper, upper inclusive). A single expected range is the same as a tuple with that range.
+CASES = [
+    (operator.add, (0, True, 10, True), (5, True, 15, True), (0, True, 15, True)),
+    (operator.sub, (0, True, 10, True), (5, True, 15, True), (0, True, 5, False)),
+    (operator.sub, (5, True, 15, True), (0, True, 10, True), (10, False, 15, True)),
+    (operator.sub, (0, True, 10, True), (10, True, 15, True), (0, True, 10, False)),
+    (operator.sub, (0, True, 10, True), (5, False, 10, True), (0, True, 5, True)),
+    (operator.sub, (0, True, 10, True), (0, True, 5, True), (5, False, 10, True)),
+    (operator.sub, (0, True, 10, True), (0, True, 10, True), EmptyRange),
+    (operator.sub, (0, True, 10, True), (0, True, 0, True), (0, False, 10, True)),
+    (operator.sub, (0, True, 10, True), (10, True, 10, True), (0, True, 10, False)),
+    (operator.sub, (0, True, 10, True), (0, False, 10, True), (0, True, 0, True)),
+    (operator.sub, (0, True, 10, True), (0, True, 10, False), (10, True, 10, True)),
+    (operator.sub, (0, True, 10, True), (4, True, 4, True), ((0, True, 4, False), (4, False, 10, True))),
+    (operator.sub, (0, True, 10, True), (0, False, 10, False), ((0, True, 0, True), (10, True, 10, True))),
+    (operator.sub, (0, False, 10, True), (0, True, 5, True), (5, False, 10, True)),
+    (operator.sub, (0, True, 10, False), (5, True, 10, True), (0, True, 5, False)),
+    (operator.sub, (0, False, 10, False), (0, True, 10, True), EmptyRange),
+    (operator.add, (0, False, 10, False), (0, True, 10, True), (0, True, 10, True)),
+    (operator.add, (0, True, 10, True), (0, False, 10, False), (0, True, 10, True)),
+    (operator.add, (0, False, 10, False), (0, True, 10, False), (0, True, 10, False)),
+    (operator.add, (0, True, 10, False), (0, False, 10, False), (0, True, 10, False)),
+    (operator.add, (0, False, 10, False), (0, False, 10, True), (0, False, 10, True)),
+    (operator.add, (0, False, 10, True), (0, False, 10, False), (0, False, 10, True)),
+    (operator.add, (0, False, 10, False), (10, True, 20, True), (0, False, 20, True)),
+    (operator.add, (10, True, 20, True), (0, False, 10, False), (0, False, 20, True)),
+    (operator.add, (0, False, 10, False), (5, False, 15, False), (0, False, 15, False)),
+    (operator.add, (5, False, 15, False), (0, False, 10, False), (0, False, 15, False)),
+    (operator.add, (0, False, 10, False), (5, True, 15, True), (0, False, 15, True)),
+    (operator.add, (5, True, 15, True), (0, False, 10, False), (0, False, 15, True)),
+    (operator.add, (0, True, 5, False), (5, True, 10, True), (0, True, 10, True)),
+    (operator.add, (0, True, 5, False), (5, False, 10, True), ((0, True, 5, False), (5, False, 10, True))),
+    (operator.add, (5, False, 10, True), (0, True, 5, False), ((5, False, 10, True), (0, True, 5, False))),
+]
+
+
+def expected_ranges(expectation):
+    if isinstance(expectation, Range):
+        return (expectation,)
+    if isinstance(expectation[0], tuple):
+        return tuple(make_range(*range_) for range_ in expectation)
+    return (make_range(*expectation),)
+
+
+@mark.parametrize(("op", "left", "right", "expectation"), CASES)
+def test_range_arithmetic(op, left, right, expectation):
+    got = op(make_range(*left), make_range(*right))
+    expectation = expected_ranges(expectation)
+    assert expectation == got, f"Expected {expectation}, but got {got}"
+
+
+def test_contains():
     range12 = Range(Bound(0, True), Bound(10, False))
 
-    assert(0 in range12, True)
-    assert(5 in range12, True)
-    assert(10 in range12, False)
-
-    def assertion(got, expectation):
-        if not isinstance(expectation, tuple):
-            expectation = (expectation,)
-        assert expectation == got, f"Expected {expectation}, but got {got}"
-
-    assertion(range1 + range2, Range(Bound(0, True), Bound(15, True)))
-    assertion(range1 - range2, Range(Bound(0, True), Bound(5, False)))
-    assertion(range2 - range1, Range(Bound(10, False), Bound(15, True)))
-    assertion(range1 - range4, Range(Bound(0, True), Bound(10, False)))
-    assertion(range1 - range3, Range(Bound(0, True), Bound(5, True)))
-    assertion(range1 - range5, Range(Bound(5, False), Bound(10, True)))
-    assertion(range1 - range7, EmptyRange)
-    assertion(range1 - range8, Range(Bound(0, False), Bound(10, True)))
-    assertion(range1 - range9, Range(Bound(0, True), Bound(10, False)))
-    assertion(range1 - range10, Range(Bound(0, True), Bound(0, True)))
-    assertion(range1 - range12, Range(Bound(10, True), Bound(10, True)))
-    assertion(
-        range1 - range11,
-        (
-            Range(Bound(0, True), Bound(4, False)),
-            Range(Bound(4, False), Bound(10, True)),
-        ),
-    )
-    assertion(
-        range1 - range6,
-        (
-            Range(Bound(0, True), Bound(0, True)),
-            Range(Bound(10, True), Bound(10, True)),
-        ),
-    )
-
-    range1 = Range(Bound(0, False), Bound(10, False))
-    range2 = Range(Bound(0, True), Bound(10, True))
-    range3 = Range(Bound(0, True), Bound(10, False))
-    range4 = Range(Bound(0, False), Bound(10, True))
-    range5 = Range(Bound(10, True), Bound(20, True))
-    range6 = Range(Bound(5, False), Bound(15, False))
-    range7 = Range(Bound(5, True), Bound(15, True))
-
-    assertion(range1 + range2, Range(Bound(0, True), Bound(10, True)))
-    assertion(range2 + range1, Range(Bound(0, True), Bound(10, True)))
-    assertion(range1 + range3, Range(Bound(0, True), Bound(10, False)))
-    assertion(range3 + range1, Range(Bound(0, True), Bound(10, False)))
-    assertion(range1 + range4, Range(Bound(0, False), Bound(10, True)))
-    assertion(range4 + range1, Range(Bound(0, False), Bound(10, True)))
-    assertion(range1 + range5, Range(Bound(0, False), Bound(20, True)))
-    assertion(range5 + range1, Range(Bound(0, False), Bound(20, True)))
-    assertion(range1 + range6, Range(Bound(0, False), Bound(15, False)))
-    assertion(range6 + range1, Range(Bound(0, False), Bound(15, False)))
-    assertion(range1 + range7, Range(Bound(0, False), Bound(15, True)))
-    assertion(range7 + range1, Range(Bound(0, False), Bound(15, True)))
+    assert 0 in range12
+    assert 5 in range12
+    assert 10 not in range12
+
+
+def test_copy_and_pickle():
+    number_line = NumberLine([make_range(0, True, 10, False), make_range(20, False, 30, True)])
+    for value in [Bound(1.5, False), make_range(0, True, 10, False), EmptyRange]:
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+    for copied in [copy.deepcopy(number_line), pickle.loads(pickle.dumps(number_line))]:
+        assert copied.ranges == number_line.ranges
+        assert copied.check(5)
+        assert not copied.check(15)
+
+
+def test_range_set_contains():
+    np = importorskip("numpy")
+    range_set = RangeSet((Range(Bound(0, True), Bound(10, False)), Range(Bound(20, False), Bound(30, True))))
+
+    assert 0 in range_set
+    assert 10 not in range_set
+    assert 20 not in range_set
+    assert 30 in range_set
+    values = np.array([[-1, 0, 5, 10], [15, 20, 25, 30]])
+    expected = np.array([[False, True, True, False], [False, False, True, True]])
+    assert np.array_equal(range_set.contains_many(values), expected)
+    assert not RangeSet(EmptyRange).contains_many([0, 1e300]).any()
+    with raises(TypeError):
+        "a" in range_set
+    with raises(TypeError):
+        range_set.contains_many(["a"])
+
+    # Integers bigger than 2**53 are not exactly representable as floats
+    big = 2**53
+    big_set = RangeSet(Range(Bound(big, False), Bound(big + 2, False)))
+    assert big + 1 in big_set
+    assert big not in big_set
+    assert big + 2 not in big_set
+    assert np.array_equal(big_set.contains_many([big, big + 1, big + 2]), [False, True, False])
+    float_set = RangeSet(Range(Bound(0, True), Bound(big, False)))
+    assert big + 1 not in float_set
+    assert not float_set.contains_many(np.array([big, big + 1])).any()
 
 
 if __name__ == "__main__":
-    test()
+    for case in CASES:
+        test_range_arithmetic(*case)
+    test_contains()
+    test_copy_and_pickle()
+    test_range_set_contains()
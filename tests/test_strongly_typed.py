@@ -29,6 +29,20 @@ def test_strongly_typed():
         add(1, 2.0)
     assert "Argument 'b' must be of type int, got float" == str(excinfo.value)
 
+    assert add(1, b=2) == 3
+    with raises(TypeError) as excinfo:
+        add(1, b="2")
+    assert "Argument 'b' must be of type int, got str" == str(excinfo.value)
+
+    @strongly_typed
+    def total(a: int, *args, scale: int = 1) -> int:
+        return (a + sum(args)) * scale
+
+    assert total(1, 2, 3, scale=2) == 12
+    with raises(TypeError) as excinfo:
+        total(1, scale="2")
+    assert "Argument 'scale' must be of type int, got str" == str(excinfo.value)
+
 
     def add2(a, b: int) -> int:
         return a + b
@@ -37,7 +51,25 @@ def test_strongly_typed():
         strongly_typed(add2, True)
     assert "Parameter 'a' lacks a type annotation." == str(excinfo.value)
 
+    @strongly_typed
     def add3(a: Any, b: int) -> int:
         return a + b
 
-    add3(1, 2)
+    assert add3(1, 2) == 3
+    assert add3(1.5, b=2) == 3.5
+    with raises(TypeError) as excinfo:
+        add3(1, 2.0)
+    assert "Argument 'b' must be of type int, got float" == str(excinfo.value)
+
+    @strongly_typed
+    def scaled(isinstance: int, scale: int = 2) -> int:
+        return isinstance * scale
+
+    assert scaled(3) == 6
+    with raises(TypeError) as excinfo:
+        scaled(3, "2")
+    assert "Argument 'scale' must be of type int, got str" == str(excinfo.value)
+
+    with raises(TypeError) as excinfo:
+        scaled()
+    assert "scaled() missing 1 required positional argument" in str(excinfo.value)
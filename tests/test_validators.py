@@ -1,6 +1,11 @@
-from pytest import raises
+import copy
+import pickle
+import warnings
 
-from checkings import Validator, ValidatorError
+from pytest import importorskip, raises, warns
+
+from checkings import Validator, ValidatorError, _base_checker
+from checkings._no_val import NoValue
 
 
 def test_validator():
@@ -25,5 +30,163 @@ def test_validator():
         Validator.is_int(value=1.46)
 
 
+def test_shared_validators():
+    assert Validator.is_int() is Validator.is_int()
+    assert Validator.is_float(default=1.0) is not Validator.is_float(default=2.0)
+    int_default = Validator.is_number(default=1)
+    assert int_default is not Validator.is_number(default=1.0)
+    assert type(int_default._default) is int
+    assert Validator.is_list(default=[]) is not Validator.is_list(default=[])
+    assert not hasattr(Validator.is_int(), "__dict__")
+
+
+def test_shared_validators_equal_values():
+    # Values which compare equal, but are different, must not share a validator
+    assert Validator(default=1.5) is Validator(default=1.5)
+    negative_zero = Validator(default=-0.0)
+    assert negative_zero is not Validator(default=0.0)
+    assert str(negative_zero._default) == "-0.0"
+    assert Validator(default=(1.0,)) is not Validator(default=(1,))
+    assert type(Validator(default=(1.0,))._default[0]) is float
+    bool_literals = Validator(literals=(True, 2))
+    assert bool_literals is not Validator(literals=(1, 2))
+    assert bool_literals._literals[0] is True
+    assert type(Validator.is_tuple(default=(1.0,))._default[0]) is float
+    assert Validator.is_int(literals=(1, 2)) is not Validator.is_int(literals=(True, 2))
+    assert Validator.is_int(literals=(True, 2))._literals[0] is True
+
+
+def test_list_of_union():
+    validator = Validator.list_of(int | str)
+    validator([1, "a"], "test")
+    with raises(ValidatorError) as e:
+        validator([1, 2.0], "test")
+    assert "int | str" in str(e.value.exceptions[0].exceptions[0])
+
+
+def test_sorted(monkeypatch):
+    np = importorskip("numpy")
+    Validator.sorted()([1, 2, 2, 3], "test")
+    Validator.sorted()(np.array([1, 2, 2, 3]), "test")
+    with raises(ValidatorError):
+        Validator.sorted()([1, 3, 2], "test")
+    with raises(ValidatorError):
+        Validator.sorted()(np.array([1, 3, 2]), "test")
+
+    # Without numpy only sequences are checked
+    monkeypatch.setattr(_base_checker, "HAS_NUMPY", False)
+    Validator.sorted()([1, 2, 2, 3], "test")
+    with raises(ValidatorError):
+        Validator.sorted()([1, 3, 2], "test")
+
+
+def test_numpy_shape():
+    np = importorskip("numpy")
+    Validator.numpy_shape(3)(np.zeros(3), "test")
+    Validator.numpy_shape((2, 3))(np.zeros((2, 3)), "test")
+    with raises(ValidatorError):
+        Validator.numpy_shape(3)(np.zeros(4), "test")
+
+    Validator.numpy(1, 3, np.float64)(np.zeros(3), "test")
+    Validator.numpy(2, (2, 3), np.float64)(np.zeros((2, 3)), "test")
+    with raises(ValidatorError):
+        Validator.numpy(1, 3, np.float64)(np.zeros(4), "test")
+    with raises(ValidatorError):
+        Validator.numpy(1, 3, np.int64)(np.zeros(3), "test")
+
+
+def test_paths(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("")
+    missing = tmp_path / "missing"
+
+    Validator.is_path()(tmp_path, "test")
+    Validator.is_path()(str(file), "test")
+    Validator.is_dir()(tmp_path, "test")
+    Validator.is_file()(file, "test")
+    for validator, value in [
+        (Validator.is_path(), missing),
+        (Validator.is_path(), "invalid\0path"),
+        (Validator.is_dir(), file),
+        (Validator.is_dir(), missing),
+        (Validator.is_file(), tmp_path),
+        (Validator.is_file(), missing),
+    ]:
+        with raises(ValidatorError):
+            validator(value, "test")
+
+
+def test_shared_validators_unchanged():
+    # Copies of a shared validator are the validator itself, so they cannot change other validators
+    validator = Validator.is_int()
+    assert copy.copy(validator) is validator
+    assert copy.deepcopy(validator) is validator
+    assert pickle.loads(pickle.dumps(validator)) is validator
+    Validator()("not an int", "test")
+
+    # Using a shared validator does not change what it adds to
+    used = Validator(types=(int, str), literals=(1,))
+    with warns(UserWarning):
+        used(1, "test")
+    combined = Validator(types=(int, str), literals=(1,)) + Validator(literals=("s",))
+    combined("s", "test")
+
+
+def test_unhashable_literals():
+    validator = Validator(literals=([1], 2))
+    validator([1], "test")
+    validator(2, "test")
+    with raises(ValidatorError):
+        validator([2], "test")
+    with raises(ValidatorError):
+        validator(3, "test")
+
+
+def test_mutable_default():
+    validator = Validator.is_list(default=[])
+    assert validator(NoValue, "test") == []
+    assert validator(NoValue, "test") is not validator(NoValue, "test")
+
+    class Unhashable:
+        __hash__ = None
+
+    with raises(ValueError):
+        Validator(default=Unhashable())
+
+
+def test_has_property():
+    class WithProperty:
+        @property
+        def prop(self):
+            raise AssertionError("the getter should not be called")
+
+    class Subclass(WithProperty):
+        pass
+
+    Validator.has_property("prop")(WithProperty(), "test")
+    Validator.has_property(property="prop")(Subclass(), "test")
+    with raises(ValidatorError):
+        Validator.has_property("prop")(1, "test")
+
+
+def test_update_once():
+    validator = Validator(literals=(1, "a"), types=int)
+    with warns(UserWarning):
+        validator(1, "test")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        validator(1, "test")
+    assert validator._literals == (1,)
+
+
 if __name__ == "__main__":
     test_validator()
+    test_shared_validators()
+    test_shared_validators_equal_values()
+    test_shared_validators_unchanged()
+    test_list_of_union()
+    test_numpy_shape()
+    test_unhashable_literals()
+    test_mutable_default()
+    test_has_property()
+    test_update_once()